@@ -1,8 +1,58 @@
 """An asynchronous client for Lidarr/Radarr/Readarr/Sonarr APIs."""
 
+from importlib import import_module as _import_module
+from typing import Any as _Any
+
+from . import const, models  # noqa: F401
 from .exceptions import *  # noqa: F401, F403
-from .models.lidarr import *  # noqa: F401, F403
-from .models.radarr import *  # noqa: F401, F403
-from .models.readarr import *  # noqa: F401, F403
-from .models.request import *  # noqa: F401, F403
-from .models.sonarr import *  # noqa: F401, F403
+
+# The models are only imported once one of their names is accessed, so
+# importing a single client doesn't build the dataclasses of every app.
+_MODEL_MODULES = {
+    "Lidarr": ".models.lidarr",
+    "Radarr": ".models.radarr",
+    "Readarr": ".models.readarr",
+    "Request": ".models.request",
+    "Sonarr": ".models.sonarr",
+}
+
+
+def _public(module: str) -> list[str]:
+    """Return the names a star import of module would bring in."""
+    return [name for name in vars(_import_module(module, __name__)) if name[0] != "_"]
+
+
+def __getattr__(name: str) -> _Any:
+    """Import the model module providing name on first access."""
+    if name == "__all__":
+        value: _Any = list(
+            dict.fromkeys(
+                [
+                    *(public for public in globals() if public[0] != "_"),
+                    *(
+                        public
+                        for module in _MODEL_MODULES.values()
+                        for public in _public(module)
+                    ),
+                ]
+            )
+        )
+    elif name[0] == "_":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    else:
+        for _, module in sorted(
+            _MODEL_MODULES.items(),
+            key=lambda item: (not name.startswith(item[0]), item[0] != "Request"),
+        ):
+            if name in _public(module):
+                value = vars(_import_module(module, __name__))[name]
+                break
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the names of the package, including the models not loaded yet."""
+    return sorted({*globals(), *__getattr__("__all__")})
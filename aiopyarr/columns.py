@@ -0,0 +1,110 @@
+"""PyArr columnar export of list responses."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Awaitable, Iterable
+from datetime import datetime, timezone
+from math import nan
+import re
+from typing import Any
+
+from .const import ResponseMode
+from .models.base import get_datetime
+from .request_client import RequestClient
+
+try:
+    import numpy as np  # type: ignore[import]
+except ImportError:  # pragma: no cover
+    np = None  # pylint: disable=invalid-name
+
+_DATETIME = re.compile(r"\d{4}-\d{2}-\d{2}T")
+_NAT = -(2**63)
+
+
+def columns(data: Any, fields: Iterable[str] | None = None) -> dict[str, Any]:
+    """Return one typed array per field of a parsed list response.
+
+    data: the raw JSON of a list, or of a paged response with records
+    fields: keys to export, nested ones joined with dots like movieFile.size,
+        all top-level keys when None
+
+    Integers become int64, floats float64 and booleans bool. Timestamps
+    become datetime64[ms], or epoch milliseconds without NumPy. Integers
+    with missing values become floats with NaN. Anything else is kept in
+    a list. Without NumPy the typed columns are array.array.
+    """
+    if isinstance(data, dict):
+        data = data.get("records", [data])
+    if fields is None:
+        fields = dict.fromkeys(key for row in data for key in row)
+    return {field: _column([_get(row, field) for row in data]) for field in fields}
+
+
+async def async_get_columns(
+    client: RequestClient, request: Awaitable[Any], fields: Iterable[str] | None = None
+) -> dict[str, Any]:
+    """Await a list request of client as raw JSON and return its columns.
+
+    For example async_get_columns(client, client.async_get_movies(), ["id"]).
+    """
+    with client.response_mode(ResponseMode.RAW):
+        data = await request
+    return columns(data, fields)
+
+
+def _get(row: dict[str, Any], field: str) -> Any:
+    """Return the value at a dotted path of a row, None when missing."""
+    if field in row:
+        return row[field]
+    value: Any = row
+    for key in field.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _column(values: list[Any]) -> Any:  # pylint: disable=too-many-return-statements
+    """Return values in the narrowest typed array that holds all of them."""
+    if not (present := [value for value in values if value is not None]):
+        return values
+    kinds = {type(value) for value in present}
+    missing = len(present) != len(values)
+    if kinds == {bool}:
+        if missing:
+            return values
+        return _typed(values, "b", "bool")
+    if kinds <= {int, float}:
+        if missing or float in kinds:
+            floats = [nan if value is None else value for value in values]
+            return _typed(floats, "d", "float64")
+        return _typed(values, "q", "int64")
+    if kinds == {str} and all(_DATETIME.match(value) for value in present):
+        return _timestamps(values)
+    return values
+
+
+def _typed(values: list[Any], typecode: str, dtype: str) -> Any:
+    """Return values in a NumPy array of dtype, or in an array.array."""
+    if np is not None:
+        return np.array(values, dtype=dtype)
+    return array(typecode, values)
+
+
+def _timestamps(values: list[str | None]) -> Any:
+    """Return ISO timestamps as milliseconds since the epoch."""
+    millis = [_NAT if value is None else _epoch_ms(value) for value in values]
+    if np is not None:
+        return np.array(millis, dtype="int64").view("datetime64[ms]")
+    if _NAT in millis:
+        return array("d", [nan if ms == _NAT else ms for ms in millis])
+    return array("q", millis)
+
+
+def _epoch_ms(value: str) -> int:
+    """Return an ISO timestamp, UTC unless it has an offset, in milliseconds."""
+    timestamp: datetime = get_datetime(value, True)  # type: ignore[assignment]
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return round(timestamp.timestamp() * 1000)
@@ -46,3 +46,11 @@ class HTTPMethod(Enum):
     GET = "GET"
     POST = "POST"
     PUT = "PUT"
+
+
+class ResponseMode(Enum):
+    """Form in which responses are returned."""
+
+    BYTES = "bytes"
+    MODEL = "model"
+    RAW = "raw"
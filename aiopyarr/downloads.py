@@ -0,0 +1,89 @@
+"""PyArr queue of downloads across apps."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from .const import ResponseMode
+from .models.const import ProtocolType
+from .request_client import RequestClient
+
+
+@dataclass
+class QueueRecord:  # pylint: disable=too-many-instance-attributes
+    """A download in the queue of one or more apps.
+
+    app: name of the app that queued it first, like Sonarr
+    items: the queue details of every app and entry sharing the download,
+        like the episodes of a season pack
+    """
+
+    app: str
+    title: str
+    size: int
+    sizeleft: int
+    timeleft: str | None
+    status: str
+    protocol: ProtocolType | str
+    downloadId: str | None  # pylint: disable=invalid-name
+    estimatedCompletionTime: datetime | None  # pylint: disable=invalid-name
+    items: list[Any] = field(default_factory=list)
+
+
+async def async_get_queue_records(
+    clients: Iterable[RequestClient],
+) -> list[QueueRecord]:
+    """Return the queue details of clients as one list, soonest done first.
+
+    The queues are requested concurrently, as models whatever the response
+    mode of each client. Entries sharing a downloadId are one record. Records
+    without an estimated completion time come last.
+    """
+    clients = list(clients)
+    queues = await asyncio.gather(*(_async_queue(client) for client in clients))
+    records: dict[str, QueueRecord] = {}
+    unidentified: list[QueueRecord] = []
+    for client, queue in zip(clients, queues):
+        for item in queue:
+            if (downloadid := getattr(item, "downloadId", None)) in records:
+                records[downloadid].items.append(item)
+                continue
+            record = _record(client.__name__, item)
+            if downloadid is None:
+                unidentified.append(record)
+            else:
+                records[downloadid] = record
+    return sorted([*records.values(), *unidentified], key=_completion)
+
+
+async def _async_queue(client: RequestClient) -> list[Any]:
+    """Return the queue details of a client as models."""
+    with client.response_mode(ResponseMode.MODEL):
+        return await client.async_get_queue_details()  # type: ignore[attr-defined]
+
+
+def _record(app: str, item: Any) -> QueueRecord:
+    """Return the record of a queue detail."""
+    return QueueRecord(
+        app=app,
+        title=getattr(item, "title", ""),
+        size=getattr(item, "size", 0),
+        sizeleft=getattr(item, "sizeleft", 0),
+        timeleft=getattr(item, "timeleft", None),
+        status=getattr(item, "status", ""),
+        protocol=getattr(item, "protocol", ProtocolType.UNKNOWN),
+        downloadId=getattr(item, "downloadId", None),
+        estimatedCompletionTime=getattr(item, "estimatedCompletionTime", None),
+        items=[item],
+    )
+
+
+def _completion(record: QueueRecord) -> tuple[bool, datetime]:
+    """Sort key of a record by estimated completion."""
+    if (eta := record.estimatedCompletionTime) is None:
+        return True, datetime.min
+    return False, eta.replace(tzinfo=None)
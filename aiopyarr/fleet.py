@@ -0,0 +1,142 @@
+"""PyArr fleet of app instances."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from aiohttp.client import ClientSession
+
+from .exceptions import ArrException
+from .request_client import RequestClient
+
+_ClientT = TypeVar("_ClientT", bound=RequestClient)
+
+
+@dataclass
+class FleetResult:
+    """Outcome of a call made on the instances of a fleet.
+
+    results: return value by instance name
+    errors: exception raised by instance name
+    timeouts: names of the instances that missed the deadline
+    """
+
+    results: dict[str, Any] = field(default_factory=dict)
+    errors: dict[str, BaseException] = field(default_factory=dict)
+    timeouts: list[str] = field(default_factory=list)
+
+
+class Fleet:
+    """Clients of many app instances sharing one session.
+
+    Clients are added by name, like sonarr-4k, with add. Calls made with
+    gather run on the instances concurrently.
+    """
+
+    def __init__(self, session: ClientSession | None = None) -> None:
+        """Initialize, a session is created and closed with the fleet if None."""
+        self._session = session
+        self._close_session = session is None
+        self._clients: dict[str, RequestClient] = {}
+
+    async def __aenter__(self) -> Fleet:
+        """Async enter."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Async exit."""
+        await self.close()
+
+    def __getitem__(self, name: str) -> RequestClient:
+        """Return the client of an instance."""
+        return self._clients[name]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the instance names."""
+        return iter(self._clients)
+
+    def __len__(self) -> int:
+        """Return the number of instances."""
+        return len(self._clients)
+
+    @property
+    def session(self) -> ClientSession:
+        """Return the session shared by the clients."""
+        if self._session is None:
+            self._session = ClientSession()
+        return self._session
+
+    def add(self, name: str, client: type[_ClientT], **kwargs: Any) -> _ClientT:
+        """Create a client of an instance on the fleet's session and return it.
+
+        kwargs: arguments of the client, like host_configuration or url and
+            api_token
+        """
+        if name in self._clients:
+            raise ArrException(message=f"Instance {name} is already in the fleet")
+        self._clients[name] = instance = client(session=self.session, **kwargs)
+        return instance
+
+    def remove(self, name: str) -> None:
+        """Remove an instance."""
+        del self._clients[name]
+
+    def instances(
+        self, app: str | None = None, names: Iterable[str] | None = None
+    ) -> dict[str, RequestClient]:
+        """Return the clients by name, of an app like Sonarr and in names if set."""
+        return {
+            name: client
+            for name, client in self._clients.items()
+            if (app is None or client.__name__ == app)
+            and (names is None or name in names)
+        }
+
+    async def gather(
+        self,
+        method: str,
+        *args: Any,
+        deadline: float | None = None,
+        app: str | None = None,
+        names: Iterable[str] | None = None,
+        **kwargs: Any,
+    ) -> FleetResult:
+        """Call a client method on the instances that have it, concurrently.
+
+        method: name of the method, like async_get_queue
+        deadline: seconds to wait for the instances, the ones still running
+            are cancelled and reported in timeouts, None to wait for all
+        app, names: only call the matching instances, see instances
+        """
+        tasks = {
+            asyncio.ensure_future(getattr(client, method)(*args, **kwargs)): name
+            for name, client in self.instances(app, names).items()
+            if callable(getattr(client, method, None))
+        }
+        result = FleetResult()
+        if not tasks:
+            return result
+        try:
+            _, pending = await asyncio.wait(tasks, timeout=deadline)
+        finally:
+            for task in tasks:
+                task.cancel()
+        for task, name in tasks.items():
+            if task in pending:
+                result.timeouts.append(name)
+            elif (error := task.exception()) is not None:
+                result.errors[name] = error
+            else:
+                result.results[name] = task.result()
+        # Wait for the cancelled calls to end and retrieve their outcome
+        await asyncio.gather(*pending, return_exceptions=True)
+        return result
+
+    async def close(self) -> None:
+        """Close the session if the fleet created it."""
+        if self._session is not None and self._close_session:
+            await self._session.close()
+            self._session = None
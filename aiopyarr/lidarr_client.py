@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
 from datetime import datetime
 from typing import Any
 
@@ -65,8 +67,18 @@ class LidarrClient(RequestClient):  # pylint: disable=too-many-public-methods
     """API client for Lidarr endpoints."""
 
     __name__ = "Lidarr"
-
-    def __init__(  # pylint: disable=too-many-arguments
+    _parse_model = LidarrParse
+    _reference_kinds = (
+        "tags",
+        "quality_profiles",
+        "metadata_profiles",
+        "release_profiles",
+        "root_folders",
+        "download_clients",
+        "indexers",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-locals
         self,
         host_configuration: PyArrHostConfiguration | None = None,
         session: ClientSession | None = None,
@@ -81,6 +93,12 @@ class LidarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         request_timeout: float = 10,
         raw_response: bool = False,
         api_ver: str = "v1",
+        decode_threshold: int | None = None,
+        decode_executor: Executor | None = None,
+        blocking_budget: float | None = None,
+        lazy_models: bool = False,
+        compact_models: bool = False,
+        track_changes: bool = False,
     ) -> None:
         """Initialize Lidarr API."""
         super().__init__(
@@ -97,6 +115,12 @@ class LidarrClient(RequestClient):  # pylint: disable=too-many-public-methods
             ssl,
             verify_ssl,
             base_api_path,
+            decode_threshold=decode_threshold,
+            decode_executor=decode_executor,
+            blocking_budget=blocking_budget,
+            lazy_models=lazy_models,
+            compact_models=compact_models,
+            track_changes=track_changes,
         )
 
     async def async_get_albums(
@@ -154,18 +178,25 @@ class LidarrClient(RequestClient):  # pylint: disable=too-many-public-methods
     async def async_get_artists(
         self,
         entryid: str | int | None = None,
+        fields: list[str] | None = None,
     ) -> LidarrArtist | list[LidarrArtist]:
         """Get info about specified artists by id, leave blank for all.
 
         entryid: Include a string to search by MusicBrainz id.
+        fields: only keep these keys of each artist.
         """
         command = "" if isinstance(entryid, str) or entryid is None else f"/{entryid}"
         return await self._async_request(
             f"artist{command}",
             params={"mbId": entryid} if isinstance(entryid, str) else None,
             datatype=LidarrArtist,
+            fields=fields,
         )
 
+    def async_iter_artists(self) -> AsyncIterator[LidarrArtist]:
+        """Iterate over all artists while they are received."""
+        return self._async_stream("artist", datatype=LidarrArtist)
+
     async def async_add_artist(self, data: LidarrArtist) -> LidarrArtist:
         """Add artist to database."""
         return await self._async_request(
@@ -380,7 +411,7 @@ class LidarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         self, data: LidarrImportList | None = None
     ) -> bool:
         """Test all import lists."""
-        _res = await self._async_request(
+        _res = await self._async_request_raw(
             f"importlist/test{ALL if data is None else ''}",
             data=None if data is None else data,
             method=HTTPMethod.POST,
@@ -653,6 +684,12 @@ class LidarrClient(RequestClient):  # pylint: disable=too-many-public-methods
             datatype=LidarrTrack,
         )
 
+    def async_iter_tracks(self, artistid: int) -> AsyncIterator[LidarrTrack]:
+        """Iterate over the tracks of an artist while they are received."""
+        return self._async_stream(
+            "track", params={ARTIST_ID: artistid}, datatype=LidarrTrack
+        )
+
     async def async_get_track_files(
         self,
         artistid: int | None = None,
@@ -0,0 +1,159 @@
+"""PyArr cache of metadata lookups by external id."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+import os
+from time import time
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from .const import ResponseMode
+from .models.radarr import RadarrMovie
+from .models.readarr import ReadarrAuthorLookup, ReadarrBookLookup, ReadarrBookTypes
+from .models.sonarr import SonarrSeriesLookup
+
+if TYPE_CHECKING:
+    from .radarr_client import RadarrClient
+    from .readarr_client import ReadarrClient
+    from .request_client import RequestClient
+    from .sonarr_client import SonarrClient
+
+
+class LookupCache:
+    """Results of metadata lookups, by app, id type and id.
+
+    The lookups of every instance of an app share the cached results, which
+    are kept as raw data and returned in the response mode of the client, built
+    with its model options, on each hit.
+    ttl: seconds results are kept for
+    negative_ttl: seconds lookups that found nothing are kept for
+    maxsize: number of results kept, the least recently used go first
+    path: file the results are loaded from, and written to by save
+    """
+
+    def __init__(
+        self,
+        ttl: float = 7 * 24 * 3600,
+        negative_ttl: float = 60,
+        maxsize: int = 4096,
+        path: str | os.PathLike[str] | None = None,
+    ) -> None:
+        """Init."""
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._maxsize = maxsize
+        self._path = path
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        """Return the number of results kept."""
+        return len(self._entries)
+
+    async def async_lookup_movie(
+        self, client: RadarrClient, movieid: int | str, tmdb: bool = True
+    ) -> list[RadarrMovie]:
+        """Lookup a movie by TMDB id, or IMDB id when tmdb is False."""
+        return await self._async_lookup(
+            client,
+            "tmdb" if tmdb else "imdb",
+            movieid,
+            RadarrMovie,
+            lambda: client.async_lookup_movie(str(movieid), tmdb),
+        )
+
+    async def async_lookup_series(
+        self, client: SonarrClient, seriesid: int
+    ) -> list[SonarrSeriesLookup]:
+        """Lookup a series by TVDB id."""
+        return await self._async_lookup(
+            client,
+            "tvdb",
+            seriesid,
+            SonarrSeriesLookup,
+            lambda: client.async_lookup_series(seriesid=seriesid),
+        )
+
+    async def async_lookup_book(
+        self,
+        client: ReadarrClient,
+        bookid: str,
+        booktype: ReadarrBookTypes = ReadarrBookTypes.ISBN,
+    ) -> list[ReadarrBookLookup]:
+        """Lookup a book by isbn, asin or goodreads id."""
+        return await self._async_lookup(
+            client,
+            booktype.value,
+            bookid,
+            ReadarrBookLookup,
+            lambda: client.async_lookup_book(bookid, booktype),
+        )
+
+    async def async_author_lookup(
+        self, client: ReadarrClient, term: str
+    ) -> list[ReadarrAuthorLookup]:
+        """Lookup an author by a term, like edition:123 or an author id."""
+        return await self._async_lookup(
+            client,
+            "author",
+            term,
+            ReadarrAuthorLookup,
+            lambda: client.async_author_lookup(term),
+        )
+
+    def clear(self) -> None:
+        """Forget the results."""
+        self._entries.clear()
+
+    def load(self, path: str | os.PathLike[str]) -> None:
+        """Add the results saved in a file, blocking."""
+        with open(path, "rb") as file:
+            entries = orjson.loads(file.read())
+        now = time()
+        for key, (expires, data) in entries.items():
+            if expires > now:
+                self._store(key, expires, data)
+
+    def save(self, path: str | os.PathLike[str] | None = None) -> None:
+        """Write the results to a file, the one given at init if None, blocking."""
+        if (path := path or self._path) is None:
+            raise ValueError("No path to save the lookup cache to")
+        now = time()
+        data = orjson.dumps(
+            {key: entry for key, entry in self._entries.items() if entry[0] > now}
+        )
+        temporary = f"{os.fspath(path)}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(data)
+        os.replace(temporary, path)
+
+    async def _async_lookup(
+        self,
+        client: RequestClient,
+        idtype: str,
+        itemid: int | str,
+        datatype: type,
+        lookup: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the results of a cached lookup, looking it up when missing."""
+        key = f"{client.__name__}:{idtype}:{itemid}"
+        if (entry := self._entries.get(key)) is not None and entry[0] > time():
+            self._entries.move_to_end(key)
+            data = entry[1]
+        else:
+            with client.response_mode(ResponseMode.RAW):
+                data = await lookup()
+            ttl = self._ttl if data else self._negative_ttl
+            self._store(key, time() + ttl, data)
+        return client._from_raw(data, datatype)  # pylint: disable=protected-access
+
+    def _store(self, key: str, expires: float, data: Any) -> None:
+        """Keep a result, dropping the least recently used past maxsize."""
+        self._entries[key] = (expires, data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
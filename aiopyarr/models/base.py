@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import date, datetime
+import ast
+import builtins
+from collections.abc import Callable, Collection, Mapping
+from contextvars import ContextVar
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import date, datetime, time
 from enum import Enum
+from functools import _CacheInfo, lru_cache
+import inspect
+from textwrap import dedent, indent
+from types import CodeType
 from typing import Any
 
 import ciso8601
+import orjson
 
-from ..const import ATTR_DATA
+from ..const import ATTR_DATA, LOGGER
 from .const import (
     CONVERT_TO_BOOL,
     CONVERT_TO_DATE,
@@ -20,20 +29,66 @@ from .const import (
     ProtocolType,
 )
 
+_COMPACT_CLASSES: dict[type, type] = {}
+_DATETIME_CACHE_SIZE = 4096
+_LAZY: ContextVar[bool] = ContextVar("_LAZY", default=False)
+_LAZY_CLASSES: dict[type, type] = {}
+_LAZY_DATA = "_lazydata"
+_TRACK: ContextVar[bool] = ContextVar("_TRACK", default=False)
+_TRACKED_CLASSES: dict[type, type] = {}
+_TRACKED_CHANGES = "_changes"
+_TRACKED_DATA = "_rawdata"
+_INTERNAL = {ATTR_DATA, _TRACKED_CHANGES, _TRACKED_DATA}
+
+_BUILD_HEAD = f"""\
+def _build(self, data, datatype=None):
+    d = self.__dict__
+    d["{ATTR_DATA}"] = None
+    if isinstance(data, dict):
+        d.update(data)
+        for key in data.keys() & _CONVERTER_KEYS:
+            d[key] = _CONVERTERS[key](d[key])
+        if "{ATTR_DATA}" in data:
+            d["{ATTR_DATA}"] = generate_data(data["{ATTR_DATA}"], datatype)
+"""
+_BUILD_LOCALS = {"d", "data", "datatype", "key", "self", "super"}
+
+
+@lru_cache(maxsize=_DATETIME_CACHE_SIZE)
+def _parse_datetime(_input: str) -> datetime | int:
+    """Parse a timezone aware datetime, shared between equal strings."""
+    if _input.isnumeric():
+        return int(_input)
+    return ciso8601.parse_datetime(_input)
+
+
+@lru_cache(maxsize=_DATETIME_CACHE_SIZE)
+def _parse_datetime_as_naive(_input: str) -> datetime | int:
+    """Parse a naive datetime, shared between equal strings."""
+    if _input.isnumeric():
+        return int(_input)
+    return ciso8601.parse_datetime_as_naive(_input)
+
 
 def get_datetime(
     _input: datetime | str | None, utc: bool = False
 ) -> datetime | str | int | None:
     """Convert input to datetime object."""
     if isinstance(_input, str):
-        if _input.isnumeric():
-            return int(_input)
         if utc:
-            return ciso8601.parse_datetime(_input)
-        return ciso8601.parse_datetime_as_naive(_input)
+            return _parse_datetime(_input)
+        return _parse_datetime_as_naive(_input)
     return _input
 
 
+def datetime_cache_info() -> dict[str, _CacheInfo]:
+    """Return the hit and miss counters of the datetime caches."""
+    return {
+        "utc": _parse_datetime.cache_info(),
+        "naive": _parse_datetime_as_naive.cache_info(),
+    }
+
+
 def get_date(_input: datetime | str | None) -> date | None:
     """Convert input to date object."""
     if (result := get_datetime(_input)) and isinstance(result, datetime):
@@ -41,21 +96,63 @@ def get_date(_input: datetime | str | None) -> date | None:
     return None
 
 
-def get_enum_value(val: str) -> str | Enum:
+@lru_cache(maxsize=None)
+def _enum_members(enum: type[Enum]) -> dict[str, Enum]:
+    """Map the lower-cased names and the values of enum to its members."""
+    members: dict[str, Enum] = {}
+    for member in enum:
+        members.setdefault(str(member.value), member)
+        members.setdefault(member.name.lower(), member)
+    return members
+
+
+def get_enum_value(val: str, enum: type[Enum] = ProtocolType) -> str | Enum:
     """Convert input to the correct enum."""
-    for protocol in ProtocolType:
-        if (
-            val.isnumeric()
-            and protocol.value == int(val)
-            or protocol.name.lower() == val
-        ):
-            return protocol
-    return val
+    members = _enum_members(enum)
+    if (member := members.get(val)) is None and val.isnumeric():
+        member = members.get(str(int(val)))
+    return val if member is None else member
+
+
+def _to_float(val: Any) -> float | None:
+    """Convert input to float."""
+    return None if val is None else float(val)
+
+
+def _to_int(val: Any) -> int | Any:
+    """Convert input to int when it holds one."""
+    if val is None:
+        return None
+    try:
+        return int(val)
+    except ValueError:
+        return val
+
+
+def _to_bool(val: Any) -> bool:
+    """Convert input to bool."""
+    return False if val == "False" else bool(val)
+
+
+def _to_datetime_utc(val: datetime | str | None) -> datetime | str | int | None:
+    """Convert input to timezone aware datetime object."""
+    return get_datetime(val, utc=True)
+
+
+_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    **dict.fromkeys(CONVERT_TO_DATETIME, get_datetime),
+    "airDateUtc": _to_datetime_utc,
+    **dict.fromkeys(CONVERT_TO_DATE, get_date),
+    **dict.fromkeys(CONVERT_TO_ENUM, get_enum_value),
+    **dict.fromkeys(CONVERT_TO_FLOAT, _to_float),
+    **dict.fromkeys(CONVERT_TO_INTEGER, _to_int),
+    **dict.fromkeys(CONVERT_TO_BOOL, _to_bool),
+}
 
 
 def toraw(obj):
     """Convert object to dict."""
-    if isinstance(obj, dict):
+    if isinstance(obj, Mapping):
         return {k: toraw(v) for k, v in obj.items()}
     if hasattr(obj, "__iter__") and not isinstance(obj, str):
         return [toraw(v) for v in obj]
@@ -79,6 +176,512 @@ def generate_data(
     return datatype(data)
 
 
+def build(  # pylint: disable=too-many-arguments
+    data: Any,
+    datatype: Any = None,
+    lazy: bool = False,
+    compact: bool = False,
+    track: bool = False,
+    keys: Collection[str] | None = None,
+) -> Any:
+    """Build the models for a parsed response.
+
+    lazy: keep each model's raw dict and build it on first attribute access.
+    compact: store the models in slots, one list item at a time.
+    track: keep each model's raw dict and record the attributes set later on.
+    keys: only keep these keys of the response objects.
+    """
+    if keys is not None:
+        data = project(data, keys)
+    if compact and datatype is not None:
+        if isinstance(data, list):
+            return [_compact(datatype(item)) for item in data]
+        return _compact(datatype(data))
+    token = _LAZY.set(lazy)
+    track_token = _TRACK.set(track)
+    try:
+        response = BaseModel(data={ATTR_DATA: data}, datatype=datatype)
+    finally:
+        _LAZY.reset(token)
+        _TRACK.reset(track_token)
+    return response.basedata
+
+
+def decode(  # pylint: disable=too-many-arguments
+    body: bytes,
+    datatype: Any = None,
+    lazy: bool = False,
+    compact: bool = False,
+    track: bool = False,
+    keys: Collection[str] | None = None,
+) -> Any:
+    """Parse a JSON response body and build its models.
+
+    Module level so it can be handed to a thread or process pool.
+    """
+    return build(orjson.loads(body), datatype, lazy, compact, track, keys)
+
+
+def project(data: Any, keys: Collection[str]) -> Any:
+    """Keep only the given keys of an object, or of each object in a list."""
+    if isinstance(data, list):
+        return [{key: item[key] for key in keys if key in item} for item in data]
+    return {key: data[key] for key in keys if key in data}
+
+
+def _compact(obj: Any) -> Any:
+    """Copy a built model, and the models it holds, into compact models."""
+    if isinstance(obj, list):
+        return [_compact(item) for item in obj]
+    if not isinstance(obj, BaseModel):
+        return obj
+    new: BaseModel = object.__new__(_compact_class(type(obj)))
+    for key, value in obj.__dict__.items():
+        setattr(new, key, _compact(value))
+    return new
+
+
+def _compact_class(cls: type) -> type:
+    """Return the __slots__ variant of cls generated from its fields.
+
+    Attributes without a field still go to __dict__, and unset fields fall
+    back to the class defaults like they do on cls.
+    """
+    if (compact := _COMPACT_CLASSES.get(cls)) is None:
+        slots = tuple(dict.fromkeys((ATTR_DATA, *(f.name for f in fields(cls)))))
+        compact = _COMPACT_CLASSES[cls] = type(
+            cls.__name__,
+            (cls,),
+            {
+                "__slots__": slots,
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+                "__getattr__": _compact_default,
+                "__reduce__": _compact_reduce,
+                "attributes": property(_compact_attributes),
+            },
+        )
+    return compact
+
+
+def _compact_model(cls: type) -> BaseModel:
+    """Return an empty compact model of cls, for unpickling."""
+    return object.__new__(_compact_class(cls))
+
+
+def _compact_reduce(self: BaseModel) -> tuple[Any, ...]:
+    """Pickle a compact model through the class it was generated from."""
+    state = (self.__dict__ or None, _compact_slots(self))
+    return _compact_model, (type(self).__base__,), state
+
+
+def _compact_default(self: BaseModel, name: str) -> Any:
+    """Return the class default for an unset field of a compact model."""
+    try:
+        return getattr(type(self).__base__, name)
+    except AttributeError:
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        ) from None
+
+
+def _compact_slots(self: BaseModel) -> dict[str, Any]:
+    """Return the set slots of a compact model."""
+    items = {}
+    for name in getattr(type(self), "__slots__"):
+        try:
+            items[name] = object.__getattribute__(self, name)
+        except AttributeError:
+            continue
+    return items
+
+
+def _compact_items(self: BaseModel) -> dict[str, Any]:
+    """Return the set slots and the __dict__ of a compact model."""
+    return _compact_slots(self) | self.__dict__
+
+
+def _compact_attributes(self: BaseModel) -> dict[str, Any]:
+    """Return attributes of the object."""
+    return _attributes(_compact_items(self))
+
+
+def _attributes(
+    items: dict[str, Any], convert: Callable[[Any], Any] = toraw
+) -> dict[str, Any]:
+    """Return the raw form of model attributes."""
+    return {
+        k: (
+            v
+            if isinstance(v, bool)
+            else str(v) if k in CONVERT_TO_INTEGER else convert(v)
+        )
+        for k, v in items.items()
+        if k not in _INTERNAL
+    }
+
+
+def _unchanged(obj: Any) -> Any:
+    """Return obj as is."""
+    return obj
+
+
+def _default(obj: Any) -> Any:  # pylint: disable=too-many-return-statements
+    """Return what toraw would make of an object orjson can't serialize.
+
+    Only the object itself is converted, orjson calls back for its contents.
+    """
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if hasattr(obj, "__iter__"):
+        return list(obj)
+    if isinstance(obj, BaseModel):
+        if _TRACKED_DATA in vars(obj):
+            return _tracked_attributes(obj)
+        if "__slots__" in vars(type(obj)):
+            return _attributes(_compact_items(obj), _unchanged)
+        return _attributes(obj.__dict__, _unchanged)
+    if hasattr(obj, "attributes"):
+        return obj.attributes
+    if isinstance(obj, datetime):
+        return f"{obj.isoformat()}Z"
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize data and models to JSON in one pass, as toraw would."""
+    return orjson.dumps(
+        obj,
+        default=_default,
+        option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME,
+    )
+
+
+def _tracked_class(cls: type) -> type:
+    """Return the subclass of cls recording the attributes set on it."""
+    if (tracked := _TRACKED_CLASSES.get(cls)) is None:
+        tracked = _TRACKED_CLASSES[cls] = type(
+            cls.__name__,
+            (cls,),
+            {
+                "__setattr__": _track_setattr,
+                "__reduce__": _tracked_reduce,
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+            },
+        )
+    return tracked
+
+
+def _tracked_model(cls: type) -> BaseModel:
+    """Return an empty tracked model of cls, for unpickling."""
+    return object.__new__(_tracked_class(cls))
+
+
+def _tracked_reduce(self: BaseModel) -> tuple[Any, ...]:
+    """Pickle a tracked model, its raw data and changes, through its model class."""
+    return _tracked_model, (type(self).__base__,), self.__dict__
+
+
+def _track_setattr(self: BaseModel, name: str, value: Any) -> None:
+    """Set an attribute and record it as changed."""
+    object.__setattr__(self, name, value)
+    self.__dict__.setdefault(_TRACKED_CHANGES, set()).add(name)
+
+
+def _tracked_attributes(obj: BaseModel) -> dict[str, Any]:
+    """Return the raw dict of a tracked model with its changes overlaid.
+
+    Every raw key was set on the model when built, those deleted since are left out.
+    """
+    items = obj.__dict__
+    return {
+        name: value for name, value in items[_TRACKED_DATA].items() if name in items
+    } | _attributes(
+        {name: items[name] for name in changed_fields(obj) if name in items},
+        _unchanged,
+    )
+
+
+def _modified(value: Any, raw: Any) -> bool:
+    """Return if value holds models changed since they were built from raw."""
+    if isinstance(value, BaseModel):
+        return _TRACKED_DATA in value.__dict__ and bool(changed_fields(value))
+    if isinstance(value, list) and value is not raw:
+        raw = raw or []
+        return len(value) != len(raw) or any(
+            _replaced(item, raw_item) or _modified(item, raw_item)
+            for item, raw_item in zip(value, raw)
+        )
+    return False
+
+
+def _replaced(value: Any, raw: Any) -> bool:
+    """Return if value is a model that wasn't built from raw."""
+    return (
+        isinstance(value, BaseModel)
+        and isinstance(raw, dict)
+        and value.__dict__.get(_TRACKED_DATA) is not raw
+    )
+
+
+def changed_fields(obj: BaseModel) -> set[str]:
+    """Return the attributes of a tracked model changed since it was built.
+
+    Attributes deleted or holding changed models count as changed, lists of
+    other values are shared with the raw dict and so are kept up to date with it.
+    """
+    items = obj.__dict__
+    if (raw := items.get(_TRACKED_DATA)) is None:
+        raise ValueError(f"{type(obj).__name__} is not tracked")
+    return set(items.get(_TRACKED_CHANGES, ())) | {
+        name
+        for name, value in raw.items()
+        if name not in items or _modified(items[name], value)
+    }
+
+
+def _lazy_class(cls: type) -> type:
+    """Return the placeholder subclass used for unbuilt models of cls."""
+    if (lazy := _LAZY_CLASSES.get(cls)) is None:
+        lazy = _LAZY_CLASSES[cls] = type(
+            cls.__name__,
+            (cls,),
+            {"__getattribute__": _materialize, "__module__": cls.__module__},
+        )
+    return lazy
+
+
+def _materialize(self: BaseModel, name: str) -> Any:
+    """Build a lazy model in place, then resolve the requested attribute.
+
+    The models created while building are lazy in turn.
+    """
+    object.__setattr__(self, "__class__", type(self).__base__)
+    data, datatype = self.__dict__.pop(_LAZY_DATA)
+    token = _LAZY.set(True)
+    try:
+        self._build(data, datatype)  # pylint: disable=protected-access
+    finally:
+        _LAZY.reset(token)
+    return getattr(self, name)
+
+
+def _compile_on_first_use(
+    self: BaseModel,
+    data: dict[str, Any] | list[dict[str, Any]],
+    datatype: Any = None,
+) -> None:
+    """Compile the _build of the model class, then build with it."""
+    cls = type(self)
+    compiled = _compile_build(cls)
+    setattr(cls, "_build", compiled)
+    compiled(self, data, datatype)
+
+
+def _compile_build(cls: type) -> Callable[..., None]:
+    """Generate a _build for cls with its __post_init__ chain inlined.
+
+    Nested models are wrapped straight from and into the instance dict and
+    other statements are kept as written, so the result behaves like the
+    generic _build. Falls back to that one when the chain can't be inlined.
+    """
+    namespace: dict[str, Any] = {
+        "_CONVERTERS": _CONVERTERS,
+        "_CONVERTER_KEYS": _CONVERTERS.keys(),
+        "generate_data": generate_data,
+    }
+    lines: list[str] = []
+    try:
+        _inline_post_init(cls, 0, namespace, lines)
+    except (OSError, TypeError, ValueError) as err:
+        LOGGER.debug("Building %s with the generic _build: %s", cls.__name__, err)
+        return BaseModel._build  # pylint: disable=protected-access
+    exec(  # pylint: disable=exec-used
+        _BUILD_HEAD + "".join(f"    {line}\n" for line in lines), namespace
+    )
+    return namespace["_build"]
+
+
+def _inline_post_init(
+    cls: type, start: int, namespace: dict[str, Any], lines: list[str]
+) -> None:
+    """Add the statements of the first __post_init__ from cls.__mro__[start:].
+
+    The source is parsed within a class, so super() compiles as in the model,
+    and is only used if it compiles to the code the method runs.
+    """
+    owner = next(base for base in cls.__mro__[start:] if "__post_init__" in vars(base))
+    func = vars(owner)["__post_init__"]
+    source = dedent(inspect.getsource(func))
+    tree = ast.parse(f"class {owner.__name__}:\n{indent(source, '    ')}")
+    if not _same_code(func.__code__, compile(tree, "<build>", "exec")):
+        raise ValueError(f"The source of {owner.__name__}.__post_init__ is stale")
+    for stmt in tree.body[0].body[0].body:  # type: ignore[attr-defined]
+        if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant):
+            continue
+        if ast.unparse(stmt) == "super().__post_init__()":
+            _inline_post_init(cls, cls.__mro__.index(owner) + 1, namespace, lines)
+        elif (wrap := _inline_wrap(cls, stmt, func.__globals__, namespace)) is not None:
+            lines.append(wrap)
+        else:
+            lines.extend(
+                _inline_statement(stmt, func.__globals__, namespace).splitlines()
+            )
+
+
+def _same_code(code: CodeType, module: CodeType) -> bool:
+    """Return if module defines a method compiled to the same bytecode as code."""
+    return any(
+        const.co_name == code.co_name
+        and const.co_code == code.co_code
+        and const.co_names == code.co_names
+        and _constants(const) == _constants(code)
+        for body in module.co_consts
+        if isinstance(body, CodeType)
+        for const in body.co_consts
+        if isinstance(const, CodeType)
+    )
+
+
+def _constants(code: CodeType) -> list[tuple[type, Any]]:
+    """Return the constants of code other than nested code, with their types."""
+    return [
+        (type(const), const)
+        for const in code.co_consts
+        if not isinstance(const, CodeType)
+    ]
+
+
+def _inline_wrap(
+    cls: type, stmt: ast.stmt, scope: dict[str, Any], namespace: dict[str, Any]
+) -> str | None:
+    """Return the dict based form of a self.x = X(self.y) style statement."""
+    if not (
+        isinstance(stmt, ast.Assign)
+        and len(stmt.targets) == 1
+        and (target := _self_attribute(stmt.targets[0]))
+    ):
+        return None
+    value = stmt.value
+    item: str | None = None
+    iterable: ast.expr | None = None
+    suffix = ""
+    if isinstance(value, ast.ListComp):
+        if not (
+            len(value.generators) == 1
+            and not (gen := value.generators[0]).ifs
+            and not gen.is_async
+            and isinstance(gen.target, ast.Name)
+        ):
+            return None
+        iterable = gen.iter
+        if (
+            isinstance(iterable, ast.BoolOp)
+            and isinstance(iterable.op, ast.Or)
+            and len(iterable.values) == 2
+            and ast.unparse(iterable.values[1]) == "[]"
+        ):
+            suffix = " or []"
+            iterable = iterable.values[0]
+        item = gen.target.id
+        value = value.elt
+    if not (
+        isinstance(value, ast.Call)
+        and isinstance(value.func, ast.Name)
+        and len(value.args) == 1
+        and not value.keywords
+    ):
+        return None
+    wrapper = _bind(value.func.id, scope, namespace)
+    if item is None:
+        if not (source := _self_attribute(value.args[0])):
+            return None
+        expr = f"{wrapper}({_read(cls, source, namespace)})"
+    else:
+        if not (
+            isinstance(value.args[0], ast.Name)
+            and value.args[0].id == item
+            and (source := _self_attribute(iterable))
+        ):
+            return None
+        expr = f"[{wrapper}(item) for item in {_read(cls, source, namespace)}{suffix}]"
+    return f"{_write(cls, target)} = {expr}"
+
+
+def _inline_statement(
+    stmt: ast.stmt, scope: dict[str, Any], namespace: dict[str, Any]
+) -> str:
+    """Return a statement as written after binding the globals it uses."""
+    nodes = list(ast.walk(stmt))
+    if any(
+        isinstance(
+            node,
+            (ast.Return, ast.Yield, ast.YieldFrom, ast.Await, ast.Global, ast.Nonlocal)
+            + (ast.Lambda, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef),
+        )
+        for node in nodes
+    ):
+        raise ValueError("Statement can't be inlined")
+    names = [node for node in nodes if isinstance(node, ast.Name)]
+    stored = {node.id for node in names if not isinstance(node.ctx, ast.Load)}
+    if stored & _BUILD_LOCALS:
+        raise ValueError("Statement shadows a _build local")
+    for node in names:
+        if node.id not in stored and node.id != "self":
+            _bind(node.id, scope, namespace)
+    return ast.unparse(stmt)
+
+
+def _bind(name: str, scope: dict[str, Any], namespace: dict[str, Any]) -> str:
+    """Make a global of a __post_init__ available to the generated code."""
+    if name in _BUILD_LOCALS:
+        raise ValueError(f"{name} can't be inlined")
+    if name in scope:
+        value = scope[name]
+    elif hasattr(builtins, name):
+        value = getattr(builtins, name)
+    else:
+        raise ValueError(f"{name} isn't defined")
+    if namespace.setdefault(name, value) is not value:
+        raise ValueError(f"{name} is bound to something else")
+    return name
+
+
+def _self_attribute(node: ast.expr | None) -> str | None:
+    """Return x for a self.x node."""
+    if (
+        isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "self"
+    ):
+        return node.attr
+    return None
+
+
+def _read(cls: type, name: str, namespace: dict[str, Any]) -> str:
+    """Return an expression reading self.name from the instance dict."""
+    try:
+        default = getattr(cls, name)
+    except AttributeError:
+        return f"self.{name}"
+    if hasattr(type(default), "__get__"):
+        return f"self.{name}"
+    namespace[alias := f"_default_{name}"] = default
+    return f'd.get("{name}", {alias})'
+
+
+def _write(cls: type, name: str) -> str:
+    """Return the target writing self.name to the instance dict."""
+    if hasattr(type(getattr(cls, name, None)), "__set__"):
+        return f"self.{name}"
+    return f'd["{name}"]'
+
+
 @dataclass(init=False)
 class BaseModel:
     """BaseModel."""
@@ -89,30 +692,34 @@ class BaseModel:
         datatype: Any = None,
     ) -> None:
         """Init."""
+        if _LAZY.get() and isinstance(data, dict):
+            self.__dict__[_LAZY_DATA] = (data, datatype)
+            self.__class__ = _lazy_class(type(self))
+            return
+        self._build(data, datatype)
+        if _TRACK.get() and isinstance(data, dict):
+            self.__dict__[_TRACKED_DATA] = data
+            self.__class__ = _tracked_class(type(self))
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Compile the _build of each model on first use."""
+        super().__init_subclass__(**kwargs)
+        setattr(cls, "_build", _compile_on_first_use)
+
+    def _build(
+        self,
+        data: dict[str, Any] | list[dict[str, Any]],
+        datatype: Any = None,
+    ) -> None:
+        """Convert data into attributes."""
         self.basedata = None
         if isinstance(data, dict):
-            for key, value in data.items():
-                if key == ATTR_DATA:
-                    value = generate_data(value, datatype)
-                elif key in CONVERT_TO_DATETIME:
-                    if key == "airDateUtc":
-                        value = get_datetime(value, utc=True)
-                    else:
-                        value = get_datetime(value)
-                elif key in CONVERT_TO_DATE:
-                    value = get_date(value)
-                elif key in CONVERT_TO_ENUM:
-                    value = get_enum_value(value)
-                elif key in CONVERT_TO_FLOAT and value is not None:
-                    value = float(value)
-                elif key in CONVERT_TO_INTEGER and value is not None:
-                    try:
-                        value = int(value)
-                    except ValueError:
-                        pass
-                elif key in CONVERT_TO_BOOL:
-                    value = False if value == "False" else bool(value)
-                self.__setattr__(key, value)
+            attrs = self.__dict__
+            attrs.update(data)
+            for key in data.keys() & _CONVERTERS.keys():
+                attrs[key] = _CONVERTERS[key](attrs[key])
+            if ATTR_DATA in data:
+                attrs[ATTR_DATA] = generate_data(data[ATTR_DATA], datatype)
 
         self.__post_init__()
 
@@ -122,12 +729,4 @@ class BaseModel:
     @property
     def attributes(self):
         """Return attributes of the object."""
-        return {
-            k: (
-                v
-                if isinstance(v, bool)
-                else str(v) if k in CONVERT_TO_INTEGER else toraw(v)
-            )
-            for k, v in self.__dict__.items()
-            if k != ATTR_DATA
-        }
+        return _attributes(self.__dict__)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
 from datetime import date as dt, datetime
 from typing import Any
 
@@ -63,8 +65,17 @@ class RadarrClient(RequestClient):  # pylint: disable=too-many-public-methods
     """API client for Radarr endpoints."""
 
     __name__ = "Radarr"
-
-    def __init__(  # pylint: disable=too-many-arguments
+    _parse_model = RadarrParse
+    _reference_kinds = (
+        "tags",
+        "quality_profiles",
+        "root_folders",
+        "languages",
+        "download_clients",
+        "indexers",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-locals
         self,
         host_configuration: PyArrHostConfiguration | None = None,
         session: ClientSession | None = None,
@@ -79,6 +90,12 @@ class RadarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         request_timeout: float = 60,
         raw_response: bool = False,
         api_ver: str = "v3",
+        decode_threshold: int | None = None,
+        decode_executor: Executor | None = None,
+        blocking_budget: float | None = None,
+        lazy_models: bool = False,
+        compact_models: bool = False,
+        track_changes: bool = False,
     ) -> None:
         """Initialize Radarr API."""
         super().__init__(
@@ -95,24 +112,37 @@ class RadarrClient(RequestClient):  # pylint: disable=too-many-public-methods
             ssl,
             verify_ssl,
             base_api_path,
+            decode_threshold=decode_threshold,
+            decode_executor=decode_executor,
+            blocking_budget=blocking_budget,
+            lazy_models=lazy_models,
+            compact_models=compact_models,
+            track_changes=track_changes,
         )
 
     async def async_get_movies(
         self,
         movieid: int | None = None,
         tmdb: bool = False,
+        fields: list[str] | None = None,
     ) -> RadarrMovie | list[RadarrMovie]:
         """Get information about movies.
 
         Include an id for a specific movie or leave black for all.
         tmdb: Use TMDB ID.
+        fields: only keep these keys of each movie.
         """
         return await self._async_request(
             f"movie{'' if movieid is None or tmdb else f'/{movieid}'}",
             params=None if movieid is None else {"tmdbid": movieid},
             datatype=RadarrMovie,
+            fields=fields,
         )
 
+    def async_iter_movies(self) -> AsyncIterator[RadarrMovie]:
+        """Iterate over all movies while they are received."""
+        return self._async_stream("movie", datatype=RadarrMovie)
+
     async def async_add_movies(
         self, data: RadarrMovie | list[RadarrMovie]
     ) -> RadarrMovie | list[RadarrMovie]:
@@ -180,15 +210,17 @@ class RadarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         )
 
     async def async_lookup_movie(
-        self, term: str, tmdb: bool = True
+        self, term: str, tmdb: bool | None = True
     ) -> list[RadarrMovie]:
         """Lookup information about movie.
 
-        tmdb: Use TMDB IDs. Set to False to use IMDB.
+        tmdb: Use TMDB IDs. Set to False to use IMDB, None to search by title.
         """
         return await self._async_request(
             "movie/lookup",
-            params={TERM: f"{'tmdb' if tmdb else 'imdb'}:{term}"},
+            params={
+                TERM: term if tmdb is None else f"{'tmdb' if tmdb else 'imdb'}:{term}"
+            },
             datatype=RadarrMovie,
         )
 
@@ -202,12 +234,13 @@ class RadarrClient(RequestClient):  # pylint: disable=too-many-public-methods
             datatype=RadarrMovieFile,
         )
 
-    async def async_get_history(
+    async def async_get_history(  # pylint: disable=too-many-arguments
         self,
         page: int = 1,
         page_size: int = 20,
         sort_key: RadarrSortKeys = RadarrSortKeys.DATE,
         event_type: RadarrEventType | None = None,
+        sort_dir: SortDirection = SortDirection.DEFAULT,
     ) -> RadarrHistory:
         """Get movie history.
 
@@ -224,6 +257,8 @@ class RadarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         }
         if event_type and event_type in RadarrEventType:
             params[EVENT_TYPE] = event_type.value
+        if sort_dir is not SortDirection.DEFAULT:
+            params[SORT_DIRECTION] = sort_dir.value
         return await self._async_request(
             "history",
             params=params,
@@ -285,7 +320,7 @@ class RadarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         self, data: RadarrImportList | None = None
     ) -> bool:
         """Test all import lists."""
-        _res = await self._async_request(
+        _res = await self._async_request_raw(
             f"importlist/test{ALL if data is None else ''}",
             data=None if data is None else data,
             method=HTTPMethod.POST,
@@ -529,7 +564,7 @@ class RadarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         self, data: RadarrNotification | None = None
     ) -> bool:
         """Test a notification configuration."""
-        _res = await self._async_request(
+        _res = await self._async_request_raw(
             f"notification/test{ALL if data is None else ''}",
             data=None if data is None else data,
             method=HTTPMethod.POST,
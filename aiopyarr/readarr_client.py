@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
 from datetime import datetime
 
 from aiohttp.client import ClientSession
@@ -70,8 +72,19 @@ class ReadarrClient(RequestClient):  # pylint: disable=too-many-public-methods
     """API client for Readarr endpoints."""
 
     __name__ = "Readarr"
-
-    def __init__(  # pylint: disable=too-many-arguments
+    _parse_model = ReadarrParse
+    _reference_kinds = (
+        "tags",
+        "quality_profiles",
+        "metadata_profiles",
+        "release_profiles",
+        "root_folders",
+        "languages",
+        "download_clients",
+        "indexers",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-locals
         self,
         host_configuration: PyArrHostConfiguration | None = None,
         session: ClientSession | None = None,
@@ -86,6 +99,12 @@ class ReadarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         request_timeout: float = 10,
         raw_response: bool = False,
         api_ver: str = "v1",
+        decode_threshold: int | None = None,
+        decode_executor: Executor | None = None,
+        blocking_budget: float | None = None,
+        lazy_models: bool = False,
+        compact_models: bool = False,
+        track_changes: bool = False,
     ) -> None:
         """Initialize Readarr API."""
         super().__init__(
@@ -102,14 +121,23 @@ class ReadarrClient(RequestClient):  # pylint: disable=too-many-public-methods
             ssl,
             verify_ssl,
             base_api_path,
+            decode_threshold=decode_threshold,
+            decode_executor=decode_executor,
+            blocking_budget=blocking_budget,
+            lazy_models=lazy_models,
+            compact_models=compact_models,
+            track_changes=track_changes,
         )
 
     async def async_get_authors(
-        self, authorid: int | None = None
+        self, authorid: int | None = None, fields: list[str] | None = None
     ) -> ReadarrAuthor | list[ReadarrAuthor]:
-        """Get info about specified author by id, leave blank for all."""
+        """Get info about specified author by id, leave blank for all.
+
+        fields: only keep these keys of each author.
+        """
         command = f"author{'' if authorid is None else f'/{authorid}'}"
-        return await self._async_request(command, datatype=ReadarrAuthor)
+        return await self._async_request(command, datatype=ReadarrAuthor, fields=fields)
 
     async def async_author_lookup(self, term: str) -> list[ReadarrAuthorLookup]:
         """Search for new authors using a term."""
@@ -296,11 +324,18 @@ class ReadarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         )
 
     async def async_get_book(
-        self, bookid: int | None = None
+        self, bookid: int | None = None, fields: list[str] | None = None
     ) -> ReadarrBook | list[ReadarrBook]:
-        """Return all books in your collection or book with matching book ID."""
+        """Return all books in your collection or book with matching book ID.
+
+        fields: only keep these keys of each book.
+        """
         path = f"book{'' if bookid is None else f'/{bookid}'}"
-        return await self._async_request(path, datatype=ReadarrBook)
+        return await self._async_request(path, datatype=ReadarrBook, fields=fields)
+
+    def async_iter_books(self) -> AsyncIterator[ReadarrBook]:
+        """Iterate over all books while they are received."""
+        return self._async_stream("book", datatype=ReadarrBook)
 
     async def async_add_book(self, data: ReadarrBook) -> ReadarrBook:
         """Add a new book and its associated author (if not already added)."""
@@ -526,7 +561,7 @@ class ReadarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         self, data: ReadarrImportList | None = None
     ) -> bool:
         """Test all import lists."""
-        _res = await self._async_request(
+        _res = await self._async_request_raw(
             f"importlist/test{ALL if data is None else ''}",
             data=None if data is None else data,
             method=HTTPMethod.POST,
@@ -651,7 +686,7 @@ class ReadarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         self, data: ReadarrNotification | None = None
     ) -> bool:
         """Test a notification configuration."""
-        _res = await self._async_request(
+        _res = await self._async_request_raw(
             f"notification/test{ALL if data is None else ''}",
             data=None if data is None else data,
             method=HTTPMethod.POST,
@@ -0,0 +1,83 @@
+"""PyArr reference data snapshots."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from time import monotonic
+from typing import Any
+
+# Keys naming an item of each kind, the first one an item has is used.
+_NAME_KEYS = ("name", "label", "path")
+
+
+class ReferenceData:
+    """The reference data of an app, with items indexed by id and name.
+
+    Kinds are the names of the list requests without async_get_, like tags
+    or quality_profiles. Names are matched case insensitively, tags by label
+    and root folders without a name by path.
+    """
+
+    def __init__(self, data: dict[str, Iterable[Any]]) -> None:
+        """Init."""
+        self.loaded = monotonic()
+        self._items = {kind: list(items) for kind, items in data.items()}
+        self._ids = {
+            kind: {_get(item, "id"): item for item in items}
+            for kind, items in self._items.items()
+        }
+        self._names: dict[str, dict[str, Any]] = {}
+        for kind, items in self._items.items():
+            names = self._names[kind] = {}
+            for item in items:
+                if (name := _name(item)) is not None:
+                    names.setdefault(name.casefold(), item)
+
+    def __getitem__(self, kind: str) -> list[Any]:
+        """Return the items of a kind."""
+        return self._items[kind]
+
+    def __contains__(self, kind: object) -> bool:
+        """Return if the snapshot holds a kind."""
+        return kind in self._items
+
+    @property
+    def kinds(self) -> list[str]:
+        """Return the kinds in the snapshot."""
+        return list(self._items)
+
+    @property
+    def age(self) -> float:
+        """Return the seconds since the snapshot was loaded."""
+        return monotonic() - self.loaded
+
+    def by_id(self, kind: str, itemid: int) -> Any:
+        """Return the item of a kind with an id, None when there is none."""
+        return self._ids[kind].get(itemid)
+
+    def by_name(self, kind: str, name: str) -> Any:
+        """Return the item of a kind with a name, None when there is none."""
+        return self._names[kind].get(name.casefold())
+
+    def names(self, kind: str, itemids: Iterable[int]) -> list[str]:
+        """Return the names of the items of a kind with ids, like a tags list."""
+        return [
+            _name(item)
+            for itemid in itemids
+            if (item := self._ids[kind].get(itemid)) is not None
+        ]
+
+
+def _get(item: Any, key: str) -> Any:
+    """Return a value of a model or of raw data."""
+    if isinstance(item, dict):
+        return item.get(key)
+    return getattr(item, key, None)
+
+
+def _name(item: Any) -> Any:
+    """Return the name of an item."""
+    for key in _NAME_KEYS:
+        if (name := _get(item, key)) is not None:
+            return name
+    return None
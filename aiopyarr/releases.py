@@ -0,0 +1,117 @@
+"""PyArr interactive release searches shared between callers."""
+
+from __future__ import annotations
+
+import asyncio
+from time import monotonic
+from typing import Any
+
+from .exceptions import ArrException
+from .request_client import RequestClient
+
+# Minutes the apps keep searched releases for, downloading them by guid and
+# indexer id only works within that window.
+_RELEASE_CACHE_MINUTES = 30
+
+
+class ReleaseSearch:
+    """A release search of a client, running or done."""
+
+    def __init__(self, client: RequestClient, params: dict[str, Any]) -> None:
+        """Start the search."""
+        self.client = client
+        self.params = params
+        self.started = monotonic()
+        self.finished: float | None = None
+        self._task = asyncio.ensure_future(
+            client.async_get_release(**params)  # type: ignore[attr-defined]
+        )
+        self._task.add_done_callback(self._finish)
+
+    def _finish(self, task: asyncio.Future[Any]) -> None:
+        """Record when the search finished, errors are raised to the waiters."""
+        self.finished = monotonic()
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def done(self) -> bool:
+        """Return if the search finished, successfully or not."""
+        return self._task.done()
+
+    @property
+    def failed(self) -> bool:
+        """Return if the search finished with an error."""
+        return self.done and (self._task.cancelled() or bool(self._task.exception()))
+
+    @property
+    def results(self) -> list[Any] | None:
+        """Return the releases found, None while searching."""
+        return self._task.result() if self.done else None
+
+    async def async_wait(self, timeout: float | None = None) -> list[Any] | None:
+        """Return the releases found, None if the search is still running at timeout.
+
+        Cancelling the wait doesn't cancel the search, others may wait for it.
+        """
+        try:
+            return await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class ReleaseSearches:
+    """Release searches, one per client and target at a time.
+
+    A search of a target being searched, or searched within ttl, returns the
+    same ReleaseSearch, whose releases can be downloaded by guid.
+    ttl: seconds searches are kept for after they finish, the release cache
+        window of the apps by default
+    """
+
+    def __init__(self, ttl: float = _RELEASE_CACHE_MINUTES * 60) -> None:
+        """Init."""
+        self._ttl = ttl
+        self._searches: dict[tuple[RequestClient, tuple], ReleaseSearch] = {}
+
+    def search(self, client: RequestClient, **params: Any) -> ReleaseSearch:
+        """Start a release search, or return the one running or kept for it.
+
+        params: arguments of the client's async_get_release, like movieid
+        """
+        self._expire()
+        key = (client, tuple(sorted(params.items())))
+        if (search := self._searches.get(key)) is None or search.failed:
+            search = self._searches[key] = ReleaseSearch(client, params)
+        return search
+
+    async def async_search(
+        self, client: RequestClient, timeout: float | None = None, **params: Any
+    ) -> list[Any] | None:
+        """Return the releases of a search, see search and ReleaseSearch.async_wait."""
+        return await self.search(client, **params).async_wait(timeout)
+
+    async def async_download(self, client: RequestClient, guid: str) -> Any:
+        """Download a release found by a kept search of client, by its guid."""
+        self._expire()
+        for (searched, _), search in self._searches.items():
+            if searched is not client or search.failed or not search.done:
+                continue
+            for release in search.results or []:
+                if release.guid != guid:
+                    continue
+                if client.__name__ == "Sonarr":
+                    return await client.async_download_release(  # type: ignore[attr-defined]
+                        release
+                    )
+                return await client.async_download_release(  # type: ignore[attr-defined]
+                    guid, release.indexerId
+                )
+        raise ArrException(client, f"Release {guid} was not found by a recent search")
+
+    def _expire(self) -> None:
+        """Drop the searches that finished more than ttl ago."""
+        expired = monotonic() - self._ttl
+        for key, search in list(self._searches.items()):
+            if search.finished is not None and search.finished < expired:
+                del self._searches[key]
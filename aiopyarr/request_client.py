@@ -4,16 +4,27 @@
 from __future__ import annotations
 
 import asyncio
+from collections import Counter, OrderedDict
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from contextvars import ContextVar
 from copy import copy
-from re import search
+from re import IGNORECASE, compile as re_compile, search, sub
+from time import monotonic, perf_counter
 from typing import Any
 
-from aiohttp.client import ClientError, ClientSession, ClientTimeout
+from aiohttp.client import (
+    ClientError,
+    ClientResponse,
+    ClientSession,
+    ClientTimeout,
+    ContentTypeError,
+)
 import orjson
 
 from .const import (
     ALL,
-    ATTR_DATA,
     HEADERS,
     HEADERS_JS,
     IS_VALID,
@@ -24,6 +35,7 @@ from .const import (
     SORT_DIRECTION,
     SORT_KEY,
     HTTPMethod,
+    ResponseMode,
 )
 from .exceptions import (
     ArrAuthenticationException,
@@ -33,7 +45,7 @@ from .exceptions import (
     ArrWrongAppException,
     ArrZeroConfException,
 )
-from .models.base import BaseModel, toraw
+from .models.base import build, decode, dumps, project
 from .models.host_configuration import PyArrHostConfiguration
 from .models.request import (
     Command,
@@ -73,13 +85,40 @@ from .models.request import (
     UIConfig,
     Update,
 )
+from .reference import ReferenceData
+from .stream import ArraySplitter
 
-
-class RequestClient:  # pylint: disable=too-many-public-methods
+_RESPONSE_MODES: ContextVar[dict[RequestClient, ResponseMode] | None] = ContextVar(
+    "_RESPONSE_MODES", default=None
+)
+# Localization strings only change with the version of an app, so one copy per
+# (appName, version) is shared by every client of the process.
+_LOCALIZATIONS: dict[tuple[str, str], dict[str, str]] = {}
+# Seconds a client reuses the app version it looks localization strings up by
+_APP_VERSION_TTL = 3600
+# Content types parsed as JSON, as ClientResponse.json accepts them
+_JSON_CONTENT_TYPE = re_compile(r"^application/(?:[\w.+-]+?\+)?json", IGNORECASE)
+# Number of titles async_parse_many remembers the results of
+_PARSE_CACHE_SIZE = 4096
+
+
+class RequestClient:  # pylint: disable=too-many-public-methods, too-many-instance-attributes
     """Base class for API Client."""
 
     __name__ = ""
     _close_session = False
+    # Model of the results of _async_parse_title
+    _parse_model: Any = None
+    # Lists loaded by async_load_reference_data, by request name without async_get_
+    _reference_kinds: tuple[str, ...] = (
+        "tags",
+        "quality_profiles",
+        "release_profiles",
+        "root_folders",
+        "languages",
+        "download_clients",
+        "indexers",
+    )
 
     def __init__(  # pylint: disable=too-many-arguments, too-many-locals
         self,
@@ -96,8 +135,34 @@ class RequestClient:  # pylint: disable=too-many-public-methods
         ssl: bool | None = None,
         verify_ssl: bool | None = None,
         base_api_path: str | None = None,
+        decode_threshold: int | None = None,
+        decode_executor: Executor | None = None,
+        blocking_budget: float | None = None,
+        lazy_models: bool = False,
+        compact_models: bool = False,
+        track_changes: bool = False,
     ) -> None:
-        """Initialize."""
+        """Initialize.
+
+        decode_threshold: response size in bytes above which decoding is moved
+            off the event loop, None to always decode on the loop
+        decode_executor: executor used for those responses, the loop's default
+            executor when None
+        blocking_budget: seconds a synchronous part of a request may hold the
+            event loop before a warning is logged, None to disable the check,
+            blocking_counts counts the warnings by route, ids replaced by {id}
+        lazy_models: keep the raw data of each returned model and only build it,
+            and then its nested models, when an attribute is first accessed
+        compact_models: store returned models in __slots__ to save memory, can't
+            be combined with lazy_models
+        track_changes: keep the raw data of returned models and record the
+            attributes set on them, so they are sent back as that data with
+            only the changes applied, can't be combined with the above
+        """
+        if lazy_models + compact_models + track_changes > 1:
+            raise ArrException(
+                message="lazy_models, compact_models and track_changes can't be combined"
+            )
         if host_configuration is None:
             host_configuration = PyArrHostConfiguration(
                 api_token=api_token,
@@ -129,9 +194,24 @@ class RequestClient:  # pylint: disable=too-many-public-methods
                 self._host.url = f"{res.group(1).rstrip('/')}:{port}/{res.group(3)}"
             self._host.url = self._host.url.rstrip("/")
         self._headers = HEADERS | {"X-Api-Key": self._host.api_token or api_token}
+        self._headers_no_body = {
+            key: value for key, value in self._headers.items() if key != "Content-Type"
+        }
+        self._api_url = self._host.api_url("")
         self._session = session
-        self._request_timeout = request_timeout
+        self._timeout = ClientTimeout(request_timeout)
         self._raw_response = raw_response
+        self._decode_threshold = decode_threshold
+        self._decode_executor = decode_executor
+        self._blocking_budget = blocking_budget
+        self.blocking_counts: Counter[str] = Counter()
+        self._lazy_models = lazy_models
+        self._compact_models = compact_models
+        self._track_changes = track_changes
+        self._app_version: tuple[float, tuple[str, str]] | None = None
+        self._reference_data: ReferenceData | None = None
+        self._parse_cache: OrderedDict[str, Any] = OrderedDict()
+        self._parses: dict[str, asyncio.Future[Any]] = {}
 
     async def __aenter__(self) -> RequestClient:
         """Async enter."""
@@ -142,49 +222,230 @@ class RequestClient:  # pylint: disable=too-many-public-methods
         if self._session and self._close_session:
             await self._session.close()
 
-    async def _async_request(  # pylint:disable=too-many-arguments
+    @contextmanager
+    def response_mode(self, mode: ResponseMode) -> Iterator[None]:
+        """Return the responses of this client's requests within the block in mode.
+
+        model: build models, raw: parsed JSON, bytes: the body as received.
+        Only requests awaited in the current task are affected.
+        """
+        token = _RESPONSE_MODES.set({**(_RESPONSE_MODES.get() or {}), self: mode})
+        try:
+            yield
+        finally:
+            _RESPONSE_MODES.reset(token)
+
+    def _current_response_mode(self) -> ResponseMode:
+        """Return the mode responses are currently returned in."""
+        if (mode := (_RESPONSE_MODES.get() or {}).get(self)) is not None:
+            return mode
+        return ResponseMode.RAW if self._raw_response else ResponseMode.MODEL
+
+    def _from_raw(self, data: Any, datatype: Any) -> Any:
+        """Return parsed JSON kept by the client as a response in the current mode.
+
+        Bytes are the data reencoded, raw data and models are built from a copy
+        the caller may change.
+        """
+        if (mode := self._current_response_mode()) is ResponseMode.BYTES:
+            return orjson.dumps(data)
+        data = orjson.loads(orjson.dumps(data))
+        if mode is ResponseMode.RAW:
+            return data
+        return build(
+            data,
+            datatype,
+            self._lazy_models,
+            self._compact_models,
+            self._track_changes,
+        )
+
+    def _check_blocking(
+        self, section: str, command: str, size: int, start: float
+    ) -> None:
+        """Log a synchronous section that held the event loop past the budget."""
+        if self._blocking_budget is None:
+            return
+        if (elapsed := perf_counter() - start) > self._blocking_budget:
+            self.blocking_counts[sub(r"/\d+(?=/|$)", "/{id}", command)] += 1
+            LOGGER.warning(
+                "Blocked the event loop for %.3f seconds while %s '%s' (%s bytes)",
+                elapsed,
+                section,
+                command,
+                size,
+            )
+
+    def _send(
         self,
         command: str,
-        params: dict | None = None,
-        data: Any = None,
-        datatype: Any = None,
-        method: HTTPMethod = HTTPMethod.GET,
+        url: str,
+        params: dict | None,
+        data: Any,
+        method: HTTPMethod,
     ) -> Any:
-        """Send API request."""
-        url = self._host.api_url(command)
-        try:
-            request = await self._session.request(
+        """Start a request, GET and DELETE without data are sent without a body."""
+        if data is None and method in (HTTPMethod.GET, HTTPMethod.DELETE):
+            return self._session.request(
                 method=method.value,
                 url=url,
                 params=params,
-                data=orjson.dumps(toraw(data)),
-                headers=self._headers,
-                timeout=ClientTimeout(self._request_timeout),
+                headers=self._headers_no_body,
+                timeout=self._timeout,
                 ssl=self._host.verify_ssl,
             )
+        start = perf_counter()
+        payload = dumps(data)
+        self._check_blocking("serializing", command, len(payload), start)
+        return self._session.request(
+            method=method.value,
+            url=url,
+            params=params,
+            data=payload,
+            headers=self._headers,
+            timeout=self._timeout,
+            ssl=self._host.verify_ssl,
+        )
 
-            if request.status >= 400:
-                if request.status == 401:
-                    raise ArrAuthenticationException(self, request)
-                if request.status == 404:
-                    raise ArrResourceNotFound(self, request)
-                raise ArrConnectionException(
-                    self,
-                    f"Request for '{url}' failed with status code '{request.status}'",
+    async def _async_request(  # pylint:disable=too-many-arguments, too-many-locals
+        self,
+        command: str,
+        params: dict | None = None,
+        data: Any = None,
+        datatype: Any = None,
+        method: HTTPMethod = HTTPMethod.GET,
+        fields: list[str] | None = None,
+    ) -> Any:
+        """Send API request.
+
+        fields: only keep these keys of the returned objects.
+        """
+        url = self._api_url + command
+        mode = self._current_response_mode()
+        with self._raise_errors(url):
+            request = await self._send(command, url, params, data, method)
+            self._raise_for_status(request, url)
+
+            body = await request.read()
+            if mode is ResponseMode.BYTES:
+                return body
+            self._raise_for_content_type(request)
+            if (
+                self._decode_threshold is not None
+                and len(body) > self._decode_threshold
+            ):
+                LOGGER.debug("Decoding %s bytes from %s off loop", len(body), url)
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._decode_executor,
+                    decode,
+                    body,
+                    None if mode is ResponseMode.RAW else datatype,
+                    self._lazy_models,
+                    self._compact_models,
+                    self._track_changes,
+                    fields,
                 )
 
-            _result: dict = await request.json()
+            start = perf_counter()
+            _result: Any = orjson.loads(body) if body.strip() else None
+            self._check_blocking("decoding", command, len(body), start)
 
             LOGGER.debug("Requesting %s returned %s", url, _result)
 
-            if self._raw_response:
-                return _result
+            if mode is ResponseMode.RAW:
+                return _result if fields is None else project(_result, fields)
+
+            start = perf_counter()
+            response = build(
+                _result,
+                datatype,
+                self._lazy_models,
+                self._compact_models,
+                self._track_changes,
+                fields,
+            )
+            self._check_blocking("building models for", command, len(body), start)
+
+        return response
+
+    async def _async_request_raw(self, command: str, **kwargs: Any) -> Any:
+        """Send API request and return the parsed JSON whatever the response mode.
 
-            response = BaseModel(
-                data={ATTR_DATA: _result},
-                datatype=datatype,
+        For methods that read the response themselves.
+        """
+        with self.response_mode(ResponseMode.RAW):
+            return await self._async_request(command, **kwargs)
+
+    async def _async_stream(
+        self, command: str, params: dict | None = None, datatype: Any = None
+    ) -> AsyncIterator[Any]:
+        """Send API request and yield the items of the returned array as they arrive.
+
+        Only the current element is buffered, not the whole body.
+        """
+        url = self._api_url + command
+        mode = self._current_response_mode()
+        with self._raise_errors(url):
+            request = await self._send(command, url, params, None, HTTPMethod.GET)
+        try:
+            with self._raise_errors(url):
+                self._raise_for_status(request, url)
+            splitter = ArraySplitter()
+            while True:
+                with self._raise_errors(url):
+                    if not (chunk := await request.content.readany()):
+                        splitter.close()
+                        return
+                    items: list[Any] = splitter.feed(chunk)
+                    if mode is not ResponseMode.BYTES:
+                        items = [orjson.loads(item) for item in items]
+                    if mode is ResponseMode.MODEL:
+                        items = build(
+                            items,
+                            datatype,
+                            self._lazy_models,
+                            self._compact_models,
+                            self._track_changes,
+                        )
+                for item in items:
+                    yield item
+        finally:
+            request.release()
+
+    def _raise_for_status(self, request: ClientResponse, url: str) -> None:
+        """Raise for an error status of a response."""
+        if request.status >= 400:
+            if request.status == 401:
+                raise ArrAuthenticationException(self, request)
+            if request.status == 404:
+                raise ArrResourceNotFound(self, request)
+            raise ArrConnectionException(
+                self,
+                f"Request for '{url}' failed with status code '{request.status}'",
             )
 
+    def _raise_for_content_type(self, request: ClientResponse) -> None:
+        """Raise for a response that isn't JSON, like ClientResponse.json does.
+
+        Bodies are decoded with orjson whether on or off the loop, this keeps
+        the check of both the same.
+        """
+        if not _JSON_CONTENT_TYPE.match(
+            ctype := request.headers.get("Content-Type", "")
+        ):
+            raise ContentTypeError(
+                request.request_info,
+                request.history,
+                status=request.status,
+                message=f"Attempt to decode JSON with unexpected mimetype: {ctype}",
+                headers=request.headers,
+            )
+
+    @contextmanager
+    def _raise_errors(self, url: str) -> Iterator[None]:
+        """Raise errors of a request to url as Arr exceptions."""
+        try:
+            yield
         except ClientError as exception:
             raise ArrConnectionException(
                 self,
@@ -203,11 +464,12 @@ class RequestClient:  # pylint: disable=too-many-public-methods
         except ArrException as ex:
             raise ArrException(self, ex) from ex
 
+        except asyncio.CancelledError:
+            raise
+
         except (Exception, BaseException) as ex:
             raise ArrException(self, ex) from ex
 
-        return response.basedata
-
     async def async_try_zeroconf(self) -> tuple[str, str, str]:
         """Get api information if login not required."""
         data = ""
@@ -375,6 +637,84 @@ class RequestClient:  # pylint: disable=too-many-public-methods
             f"system/backup/{backupid}", method=HTTPMethod.DELETE
         )
 
+    async def async_load_reference_data(
+        self, max_age: float | None = None
+    ) -> ReferenceData:
+        """Load tags, profiles, root folders, indexers and the like at once.
+
+        The lists are requested concurrently and returned in one snapshot,
+        indexed by id and name.
+        max_age: seconds the last snapshot is reused for, None to always load
+        """
+        if (
+            max_age is not None
+            and (data := self._reference_data) is not None
+            and data.age < max_age
+        ):
+            return data
+        lists = await asyncio.gather(
+            *(getattr(self, f"async_get_{kind}")() for kind in self._reference_kinds)
+        )
+        self._reference_data = ReferenceData(dict(zip(self._reference_kinds, lists)))
+        return self._reference_data
+
+    async def async_parse_many(
+        self,
+        titles: Iterable[str],
+        concurrency: int = 8,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Parse release titles concurrently, in the order given.
+
+        The results are remembered by title, ignoring case and spacing, until
+        clear_parse_cache is called, and a title already being parsed is
+        awaited instead of sent again. Each call returns its own results, in
+        the current response mode.
+        concurrency: number of titles sent at once
+        return_exceptions: return errors in place of results, like
+            asyncio.gather, instead of raising the first one
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(
+            *(self._async_parse_cached(title, semaphore) for title in titles),
+            return_exceptions=return_exceptions,
+        )
+
+    def clear_parse_cache(self) -> None:
+        """Forget the titles parsed, for when the library changed."""
+        self._parse_cache.clear()
+
+    async def _async_parse_cached(
+        self, title: str, semaphore: asyncio.Semaphore
+    ) -> Any:
+        """Return the remembered result of a title or parse it."""
+        if (key := " ".join(title.split()).casefold()) in self._parse_cache:
+            self._parse_cache.move_to_end(key)
+            return self._from_raw(self._parse_cache[key], self._parse_model)
+        if (parse := self._parses.get(key)) is None:
+            parse = self._parses[key] = asyncio.ensure_future(
+                self._async_parse_uncached(key, title, semaphore)
+            )
+            parse.add_done_callback(lambda _: self._parses.pop(key, None))
+        return self._from_raw(await asyncio.shield(parse), self._parse_model)
+
+    async def _async_parse_uncached(
+        self, key: str, title: str, semaphore: asyncio.Semaphore
+    ) -> Any:
+        """Parse a title and remember the raw result."""
+        async with semaphore:
+            with self.response_mode(ResponseMode.RAW):
+                result = await self._async_parse_title(title)
+        self._parse_cache[key] = result
+        if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return result
+
+    async def _async_parse_title(self, title: str) -> Any:
+        """Parse a title with the parse endpoint of the app, into _parse_model."""
+        # pylint: disable-next=no-member
+        return await self.async_parse(title)  # type: ignore[attr-defined]
+
     async def async_get_tags(self, tagid: int | None = None) -> Tag | list[Tag]:
         """Return all tags or specific tag by database id.
 
@@ -486,7 +826,7 @@ class RequestClient:  # pylint: disable=too-many-public-methods
         self, data: DownloadClient | None = None
     ) -> bool:
         """Test download client configurations."""
-        _res = await self._async_request(
+        _res = await self._async_request_raw(
             f"downloadclient/test{ALL if data is None else ''}",
             data=None if data is None else data,
             method=HTTPMethod.POST,
@@ -530,7 +870,7 @@ class RequestClient:  # pylint: disable=too-many-public-methods
     async def async_get_filesystem_media_type(self, path: str) -> str:
         """Return whether queried path is a file or folder."""
         return (
-            await self._async_request(
+            await self._async_request_raw(
                 "filesystem/type",
                 params={PATH: path},
             )
@@ -654,7 +994,7 @@ class RequestClient:  # pylint: disable=too-many-public-methods
 
     async def async_test_indexers(self, data: Indexer | None = None) -> bool:
         """Test an indexer configuration."""
-        _res = await self._async_request(
+        _res = await self._async_request_raw(
             f"indexer/test{ALL if data is None else ''}",
             data=None if data is None else data,
             method=HTTPMethod.POST,
@@ -698,8 +1038,27 @@ class RequestClient:  # pylint: disable=too-many-public-methods
         )
 
     async def async_get_localization(self) -> Localization:
-        """Get localization strings."""
-        return await self._async_request("localization", datatype=Localization)
+        """Get localization strings.
+
+        The read-only strings are shared by all clients of the same app and
+        version, each call returns a plain model around them whatever models
+        the client was set up to return. The version is read from system/status,
+        an extra request on the first call and once an hour after.
+        """
+        if self._current_response_mode() is not ResponseMode.MODEL:
+            return await self._async_request("localization", datatype=Localization)
+        with self.response_mode(ResponseMode.RAW):
+            if self._app_version is None or self._app_version[0] < monotonic():
+                status = await self._async_request("system/status")
+                self._app_version = (
+                    monotonic() + _APP_VERSION_TTL,
+                    (status["appName"], status["version"]),
+                )
+            version = self._app_version[1]
+            if (strings := _LOCALIZATIONS.get(version)) is None:
+                raw = await self._async_request("localization")
+                strings = _LOCALIZATIONS.setdefault(version, raw.get("Strings", {}))
+        return Localization({"Strings": strings})
 
     async def async_get_image(
         self,
@@ -805,7 +1164,7 @@ class RequestClient:  # pylint: disable=too-many-public-methods
 
     async def async_test_metadata(self, data: MetadataConfig | None = None) -> bool:
         """Test a metadata configuration."""
-        _res = await self._async_request(
+        _res = await self._async_request_raw(
             f"metadata/test{ALL if data is None else ''}",
             data=None if data is None else data,
             method=HTTPMethod.POST,
@@ -829,7 +1188,9 @@ class RequestClient:  # pylint: disable=too-many-public-methods
 
     async def async_test_all_notifications(self) -> bool:
         """Test all notification configurations."""
-        _res = await self._async_request("notification/testall", method=HTTPMethod.POST)
+        _res = await self._async_request_raw(
+            "notification/testall", method=HTTPMethod.POST
+        )
         for item in _res:
             if item[IS_VALID] is False:
                 return False
@@ -1019,12 +1380,12 @@ class RequestClient:  # pylint: disable=too-many-public-methods
 
     async def async_system_shutdown(self) -> bool:
         """Shutdown the system."""
-        _res = await self._async_request("system/shutdown", method=HTTPMethod.POST)
+        _res = await self._async_request_raw("system/shutdown", method=HTTPMethod.POST)
         return _res["shuttingDown"] is True
 
     async def async_system_restart(self) -> bool:
         """Restart the system."""
-        _res = await self._async_request("system/restart", method=HTTPMethod.POST)
+        _res = await self._async_request_raw("system/restart", method=HTTPMethod.POST)
         return _res["restarting"] is True
 
     async def async_get_system_tasks(
@@ -0,0 +1,134 @@
+"""PyArr search across apps."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+from .const import LOGGER, ResponseMode
+from .models.lidarr import LidarrSearch
+from .models.radarr import RadarrMovie
+from .models.readarr import ReadarrSearch
+from .models.sonarr import SonarrSeriesLookup
+from .request_client import RequestClient
+
+# The free text lookup of each app and the model of its results, Lidarr and
+# Readarr search finds both artists and albums, or authors and books.
+# pylint: disable-next=consider-using-namedtuple-or-dataclass
+_LOOKUPS: dict[str, tuple[Callable[[Any, str], Awaitable[list[Any]]], type]] = {
+    "Lidarr": (lambda client, term: client.async_search(term), LidarrSearch),
+    "Radarr": (
+        lambda client, term: client.async_lookup_movie(term, tmdb=None),
+        RadarrMovie,
+    ),
+    "Readarr": (lambda client, term: client.async_search(term), ReadarrSearch),
+    "Sonarr": (
+        lambda client, term: client.async_lookup_series(term),
+        SonarrSeriesLookup,
+    ),
+}
+# Raw items found by a search, with the client each came from
+_Found = list[tuple[RequestClient, Any]]
+
+
+@dataclass
+class SearchResult:
+    """A result of a search, with the app and client it came from."""
+
+    app: str
+    client: RequestClient
+    item: Any
+
+
+class Search:
+    """Look up a term on the clients of several apps at once.
+
+    Results are cached per term, ignoring case and spacing, searches that
+    found nothing for a shorter time, and a term already being searched for
+    is awaited instead of searched again. The raw results are cached, each
+    call gets its own items in the response mode of their client.
+    ttl: seconds results are cached for
+    negative_ttl: seconds an empty result is cached for
+    maxsize: number of terms cached
+    """
+
+    def __init__(
+        self,
+        clients: Iterable[RequestClient],
+        ttl: float = 300,
+        negative_ttl: float = 60,
+        maxsize: int = 1024,
+    ) -> None:
+        """Init."""
+        self._clients = [client for client in clients if client.__name__ in _LOOKUPS]
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._maxsize = maxsize
+        self._cache: OrderedDict[str, tuple[float, _Found]] = OrderedDict()
+        self._searches: dict[str, asyncio.Future[_Found]] = {}
+
+    def clear(self) -> None:
+        """Forget the cached results."""
+        self._cache.clear()
+
+    async def async_search_everything(self, term: str) -> list[SearchResult]:
+        """Return what the apps found for a term, by app in the client order.
+
+        An app failing is logged and left out, its results aren't cached.
+        """
+        key = " ".join(term.casefold().split())
+        if (cached := self._cache.get(key)) is not None:
+            if cached[0] > monotonic():
+                self._cache.move_to_end(key)
+                return _results(cached[1])
+            del self._cache[key]
+        if (search := self._searches.get(key)) is None:
+            search = self._searches[key] = asyncio.ensure_future(
+                self._search(key, term)
+            )
+            search.add_done_callback(lambda _: self._searches.pop(key, None))
+        return _results(await asyncio.shield(search))
+
+    async def _search(self, key: str, term: str) -> _Found:
+        """Search the clients for a term and cache the raw results under key."""
+        found = await asyncio.gather(
+            *(_raw_lookup(client, term) for client in self._clients),
+            return_exceptions=True,
+        )
+        results: _Found = []
+        failed = False
+        for client, items in zip(self._clients, found):
+            if isinstance(items, BaseException):
+                LOGGER.warning("Searching %s failed: %s", client.__name__, items)
+                failed = True
+                continue
+            results.extend((client, item) for item in items)
+        if not failed:
+            ttl = self._ttl if results else self._negative_ttl
+            self._cache[key] = (monotonic() + ttl, results)
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+        return results
+
+
+async def _raw_lookup(client: RequestClient, term: str) -> list[Any]:
+    """Look up a term on a client, returning the parsed JSON."""
+    with client.response_mode(ResponseMode.RAW):
+        return await _LOOKUPS[client.__name__][0](client, term)
+
+
+def _results(found: _Found) -> list[SearchResult]:
+    """Return the results of raw items found, in the mode of their client."""
+    return [
+        SearchResult(
+            client.__name__,
+            client,
+            # pylint: disable-next=protected-access
+            client._from_raw(item, _LOOKUPS[client.__name__][1]),
+        )
+        for client, item in found
+    ]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
 from datetime import datetime
 from typing import Any
 
@@ -62,8 +64,9 @@ class SonarrClient(RequestClient):  # pylint: disable=too-many-public-methods
     """API client for Sonarr endpoints."""
 
     __name__ = "Sonarr"
+    _parse_model = SonarrParse
 
-    def __init__(  # pylint: disable=too-many-arguments
+    def __init__(  # pylint: disable=too-many-arguments, too-many-locals
         self,
         host_configuration: PyArrHostConfiguration | None = None,
         session: ClientSession | None = None,
@@ -78,6 +81,12 @@ class SonarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         request_timeout: float = 30,
         raw_response: bool = False,
         api_ver: str = "v3",
+        decode_threshold: int | None = None,
+        decode_executor: Executor | None = None,
+        blocking_budget: float | None = None,
+        lazy_models: bool = False,
+        compact_models: bool = False,
+        track_changes: bool = False,
     ) -> None:
         """Initialize Sonarr API."""
         super().__init__(
@@ -94,6 +103,12 @@ class SonarrClient(RequestClient):  # pylint: disable=too-many-public-methods
             ssl,
             verify_ssl,
             base_api_path,
+            decode_threshold=decode_threshold,
+            decode_executor=decode_executor,
+            blocking_budget=blocking_budget,
+            lazy_models=lazy_models,
+            compact_models=compact_models,
+            track_changes=track_changes,
         )
 
     async def async_get_episode_files(
@@ -242,13 +257,23 @@ class SonarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         )
 
     async def async_get_episodes(
-        self, entryid: int, series: bool = False
+        self, entryid: int, series: bool = False, fields: list[str] | None = None
     ) -> SonarrEpisode | list[SonarrEpisode]:
-        """Get all episodes from a given series or episode id."""
+        """Get all episodes from a given series or episode id.
+
+        fields: only keep these keys of each episode.
+        """
         return await self._async_request(
             f"episode{'' if series else f'/{entryid}'}",
             params={SERIES_ID: entryid} if series else None,
             datatype=SonarrEpisode,
+            fields=fields,
+        )
+
+    def async_iter_episodes(self, seriesid: int) -> AsyncIterator[SonarrEpisode]:
+        """Iterate over the episodes of a series while they are received."""
+        return self._async_stream(
+            "episode", params={SERIES_ID: seriesid}, datatype=SonarrEpisode
         )
 
     async def async_edit_episode(self, data: SonarrEpisode) -> SonarrEpisode:
@@ -288,6 +313,7 @@ class SonarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         sort_key: SonarrSortKeys = SonarrSortKeys.DATE,
         recordid: int | None = None,
         event_type: SonarrEventType | None = None,
+        sort_dir: SortDirection = SortDirection.DEFAULT,
     ) -> SonarrHistory:
         """Get history (grabs/failures/completed).
 
@@ -307,6 +333,8 @@ class SonarrClient(RequestClient):  # pylint: disable=too-many-public-methods
             params[EVENT_TYPE] = event_type.value
         if recordid is not None:
             params[EPISODE_ID] = recordid
+        if sort_dir is not SortDirection.DEFAULT:
+            params[SORT_DIRECTION] = sort_dir.value
         return await self._async_request(
             "history", datatype=SonarrHistory, params=params
         )
@@ -370,6 +398,10 @@ class SonarrClient(RequestClient):  # pylint: disable=too-many-public-methods
             datatype=SonarrWantedMissing,
         )
 
+    async def _async_parse_title(self, title: str) -> SonarrParse:
+        """Parse a title with the parse endpoint of the app."""
+        return await self.async_parse_title_or_path(title=title)
+
     async def async_parse_title_or_path(
         self, title: str | None = None, path: str | None = None
     ) -> SonarrParse:
@@ -435,17 +467,23 @@ class SonarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         )
 
     async def async_get_series(
-        self, seriesid: int | None = None
+        self, seriesid: int | None = None, fields: list[str] | None = None
     ) -> SonarrSeries | list[SonarrSeries]:
         """Return all series in your collection or the series with the matching.
 
         series ID if one is found.
+        fields: only keep these keys of each series.
         """
         return await self._async_request(
             f"series{'' if seriesid is None else f'/{seriesid}'}",
             datatype=SonarrSeries,
+            fields=fields,
         )
 
+    def async_iter_series(self) -> AsyncIterator[SonarrSeries]:
+        """Iterate over all series while they are received."""
+        return self._async_stream("series", datatype=SonarrSeries)
+
     async def async_add_series(self, data: SonarrSeriesAdd) -> SonarrSeries:
         """Add a new series to your collection."""
         return await self._async_request(
@@ -522,7 +560,7 @@ class SonarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         self, data: SonarrImportList | None = None
     ) -> bool:
         """Test all import lists."""
-        _res = await self._async_request(
+        _res = await self._async_request_raw(
             f"importlist/test{ALL if data is None else ''}",
             data=None if data is None else data,
             method=HTTPMethod.POST,
@@ -665,7 +703,7 @@ class SonarrClient(RequestClient):  # pylint: disable=too-many-public-methods
         self, data: SonarrNotification | None = None
     ) -> bool:
         """Test a notification configuration."""
-        _res = await self._async_request(
+        _res = await self._async_request_raw(
             f"notification/test{ALL if data is None else ''}",
             data=None if data is None else data,
             method=HTTPMethod.POST,
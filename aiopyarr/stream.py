@@ -0,0 +1,76 @@
+"""PyArr streaming JSON decoding."""
+
+from __future__ import annotations
+
+import re
+
+import orjson
+
+from .exceptions import ArrException
+
+# Everything up to the next bracket, with strings skipped as a whole. A match
+# stops at a quote when the string continues in the next chunk.
+_SKIP = re.compile(rb'[^"\[\]{}]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"\[\]{}]*)*', re.DOTALL)
+_OPEN = b"[{"
+_QUOTE = ord('"')
+_SEPARATORS = b" \t\r\n,"
+
+
+class ArraySplitter:
+    """Split a top-level JSON array into its elements as the body arrives.
+
+    Only brackets are tracked, strings are skipped by a regex and the
+    elements themselves are left to the JSON parser.
+    """
+
+    def __init__(self) -> None:
+        """Init."""
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._start = 0
+        self._done = False
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add a chunk of the body and return the elements it completed."""
+        buffer = self._buffer
+        buffer += chunk
+        items: list[bytes] = []
+        while not self._done:
+            end = _SKIP.match(buffer, self._pos).end()  # type: ignore[union-attr]
+            if end == len(buffer) or buffer[end] == _QUOTE:
+                self._pos = end
+                break
+            self._pos = end + 1
+            if buffer[end] in _OPEN:
+                if self._depth == 0:
+                    if buffer[end] != _OPEN[0] or buffer[:end].strip():
+                        raise ArrException(message="Response is not a JSON array")
+                    self._start = self._pos
+                elif self._depth == 1:
+                    self._add_scalars(items, end)
+                    self._start = end
+                self._depth += 1
+                continue
+            self._depth -= 1
+            if self._depth == 1:
+                items.append(bytes(buffer[self._start : self._pos]))
+                self._start = self._pos
+            elif self._depth == 0:
+                self._add_scalars(items, end)
+                self._done = True
+        if self._start:
+            del buffer[: self._start]
+            self._pos -= self._start
+            self._start = 0
+        return items
+
+    def close(self) -> None:
+        """Check the body held a complete array."""
+        if not self._done:
+            raise ArrException(message="Response ended before the JSON array")
+
+    def _add_scalars(self, items: list[bytes], end: int) -> None:
+        """Add the elements that aren't objects or arrays before end."""
+        if scalars := self._buffer[self._start : end].strip(_SEPARATORS):
+            items.extend(map(orjson.dumps, orjson.loads(b"[" + scalars + b"]")))
@@ -0,0 +1,71 @@
+"""PyArr history of many apps as one timeline."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterable
+from datetime import datetime, timedelta
+import heapq
+from itertools import count
+from typing import Any
+
+from .models.request import SortDirection
+from .request_client import RequestClient
+
+
+class _History:  # pylint: disable=too-few-public-methods
+    """The history of a client, requested a page at a time, newest first."""
+
+    def __init__(self, client: RequestClient, page_size: int) -> None:
+        """Init."""
+        self.client = client
+        self._page_size = page_size
+        self._page = 0
+        self._done = False
+        self._records: deque[Any] = deque()
+
+    async def async_next(self) -> Any:
+        """Return the next record, requesting a page when needed, None at the end."""
+        if not self._records and not self._done:
+            self._page += 1
+            history = await self.client.async_get_history(  # type: ignore[attr-defined]
+                self._page, self._page_size, sort_dir=SortDirection.DESCENDING
+            )
+            self._records.extend(history.records)
+            self._done = (
+                len(history.records) < self._page_size
+                or self._page * self._page_size >= history.totalRecords
+            )
+        return self._records.popleft() if self._records else None
+
+
+async def async_iter_history(
+    clients: Iterable[RequestClient], page_size: int = 20
+) -> AsyncIterator[tuple[RequestClient, Any]]:
+    """Yield the history records of clients, newest first, with their client.
+
+    The histories are merged as they are read, a page of a client is only
+    requested when its records are next, so the first records come after
+    reading about that many from each client.
+    """
+    histories = [_History(client, page_size) for client in clients]
+    order = count()
+    heap = [
+        (_age(record), next(order), index, record)
+        for index, record in enumerate(
+            await asyncio.gather(*(history.async_next() for history in histories))
+        )
+        if record is not None
+    ]
+    heapq.heapify(heap)
+    while heap:
+        _, _, index, record = heapq.heappop(heap)
+        yield histories[index].client, record
+        if (record := await histories[index].async_next()) is not None:
+            heapq.heappush(heap, (_age(record), next(order), index, record))
+
+
+def _age(record: Any) -> timedelta:
+    """Sort key of a record, smallest for the newest."""
+    return datetime.max - record.date.replace(tzinfo=None)
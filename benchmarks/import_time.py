@@ -0,0 +1,54 @@
+"""Measure the cold import time of aiopyarr.
+
+Each statement is timed in fresh interpreters, with aiohttp already imported
+so only the time spent in aiopyarr is counted, and the best run is printed.
+Run it on two checkouts to compare them:
+
+    python benchmarks/import_time.py --runs 10
+"""
+
+import argparse
+import pathlib
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import aiopyarr",
+    "from aiopyarr.sonarr_client import SonarrClient",
+)
+TIMER = (
+    "import aiohttp, time\n"
+    "start = time.perf_counter()\n"
+    "{statement}\n"
+    "print(time.perf_counter() - start)"
+)
+
+
+def import_time(statement: str, runs: int) -> float:
+    """Return the best time in seconds of statement in a new interpreter."""
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", TIMER.format(statement=statement)],
+                capture_output=True,
+                check=True,
+                cwd=pathlib.Path(__file__).parent.parent,
+                text=True,
+            ).stdout
+        )
+        for _ in range(runs)
+    )
+
+
+def main() -> None:
+    """Print the import time of each statement."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="runs per statement")
+    args = parser.parse_args()
+    for statement in STATEMENTS:
+        best = import_time(statement, args.runs)
+        print(f"{statement}: {best * 1000:.1f} ms (best of {args.runs})")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,7 @@ setup(
     package_data={"aiopyarr": ["py.typed"]},
     packages=find_packages(include=["aiopyarr", "aiopyarr*"]),
     install_requires=["aiohttp>=3.6.1,<4.0"],
+    extras_require={"numpy": ["numpy"]},
     keywords=["aiopyarr", "radarr", "sonarr", "plex"],
     license="MIT license",
     classifiers=[
@@ -0,0 +1,73 @@
+"""Tests for the columnar export."""
+
+# pylint:disable=line-too-long
+from array import array
+from math import isnan
+
+from aresponses.main import ResponsesMockServer as Server
+import pytest
+
+from aiopyarr import columns as columns_module
+from aiopyarr.columns import async_get_columns, columns
+from aiopyarr.sonarr_client import SonarrClient
+
+from . import SONARR_API, load_fixture
+
+ROWS = [
+    {"id": 1, "size": 10, "monitored": True, "added": "2020-01-01T00:00:00Z"},
+    {"id": 2, "size": None, "monitored": False, "added": "2020-01-01T00:00:01.5Z"},
+]
+
+
+@pytest.mark.asyncio
+async def test_async_get_columns(
+    aresponses: Server, sonarr_client: SonarrClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test building columns from a paged response without models."""
+    monkeypatch.setattr(columns_module, "np", None)
+    aresponses.add(
+        "127.0.0.1:8989",
+        f"/api/{SONARR_API}/queue?page=1&pageSize=20&sortDirection=default&sortKey=timeleft&includeUnknownSeriesItems=False&includeSeries=False&includeEpisode=False",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("sonarr/queue.json"),
+        ),
+        match_querystring=True,
+    )
+    data = await async_get_columns(
+        sonarr_client,
+        sonarr_client.async_get_queue(),
+        ["id", "sizeleft", "estimatedCompletionTime", "quality.quality.name", "nope"],
+    )
+
+    assert data["id"] == array("q", [0, 0])
+    assert data["sizeleft"] == array("d", [100000, 100000])
+    assert data["estimatedCompletionTime"] == array("q", [1581254054380] * 2)
+    assert data["quality.quality.name"] == ["string", "string"]
+    assert data["nope"] == [None, None]
+
+
+def test_columns_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test columns fall back to array.array."""
+    monkeypatch.setattr(columns_module, "np", None)
+    data = columns(ROWS)
+
+    assert list(data) == ["id", "size", "monitored", "added"]
+    assert data["id"] == array("q", [1, 2])
+    assert data["size"][0] == 10
+    assert isnan(data["size"][1])
+    assert data["monitored"] == array("b", [True, False])
+    assert data["added"] == array("q", [1577836800000, 1577836801500])
+
+
+def test_columns_with_numpy() -> None:
+    """Test columns are NumPy arrays when it is installed."""
+    numpy = pytest.importorskip("numpy")
+    data = columns(ROWS, ["id", "size", "monitored", "added"])
+
+    assert data["id"].dtype == numpy.int64
+    assert data["size"].dtype == numpy.float64
+    assert data["monitored"].dtype == numpy.bool_
+    assert data["added"][1] == numpy.datetime64("2020-01-01T00:00:01.500")
@@ -0,0 +1,81 @@
+"""Tests for the queue of downloads across apps."""
+
+# pylint:disable=line-too-long
+from datetime import datetime
+
+from aiohttp import ClientSession
+from aresponses.main import ResponsesMockServer as Server
+import orjson
+import pytest
+
+from aiopyarr.const import ResponseMode
+from aiopyarr.downloads import async_get_queue_records
+from aiopyarr.models.const import ProtocolType
+from aiopyarr.models.radarr import RadarrQueueDetail
+from aiopyarr.radarr_client import RadarrClient
+from aiopyarr.sonarr_client import SonarrClient
+
+from . import RADARR_API, SONARR_API, TEST_HOST_CONFIGURATION, load_fixture
+
+
+def _queue(fixture: str, *entries: tuple[str, str | None]) -> str:
+    """Return a queue of the fixture item with downloadId and ETA replaced."""
+    item = orjson.loads(load_fixture(fixture))[0]
+    return orjson.dumps(
+        [
+            item | {"downloadId": downloadid, "estimatedCompletionTime": eta}
+            for downloadid, eta in entries
+        ]
+    ).decode()
+
+
+@pytest.mark.asyncio
+async def test_async_get_queue_records(
+    aresponses: Server, apisession: ClientSession, sonarr_client: SonarrClient
+) -> None:
+    """Test merging the queues of apps by estimated completion."""
+    aresponses.add(
+        "127.0.0.1:8989",
+        f"/api/{SONARR_API}/queue/details?includeUnknownSeriesItems=False&includeSeries=True&includeEpisode=True",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=_queue(
+                "sonarr/queue-details.json",
+                ("pack", "2022-01-07T10:40:00Z"),
+                ("pack", "2022-01-07T10:40:00Z"),
+                ("episode", None),
+            ),
+        ),
+        match_querystring=True,
+    )
+    aresponses.add(
+        "127.0.0.1:7878",
+        f"/api/{RADARR_API}/queue/details?includeUnknownMovieItems=False&includeMovie=True",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=_queue("radarr/queue-details.json", ("movie", "2022-01-07T09:00:00Z")),
+        ),
+        match_querystring=True,
+    )
+    radarr_client = RadarrClient(
+        host_configuration=TEST_HOST_CONFIGURATION,
+        session=apisession,
+        raw_response=True,
+    )
+    with sonarr_client.response_mode(ResponseMode.RAW):
+        records = await async_get_queue_records([sonarr_client, radarr_client])
+    assert [(record.app, record.downloadId) for record in records] == [
+        ("Radarr", "movie"),
+        ("Sonarr", "pack"),
+        ("Sonarr", "episode"),
+    ]
+    assert len(records[1].items) == 2
+    assert records[1].size == 200000
+    assert records[1].estimatedCompletionTime == datetime(2022, 1, 7, 10, 40)
+    assert records[0].protocol is ProtocolType.UNKNOWN
+    assert records[0].title == "string"
+    assert isinstance(records[0].items[0], RadarrQueueDetail)
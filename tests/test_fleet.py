@@ -0,0 +1,98 @@
+"""Tests for fleets of app instances."""
+
+import asyncio
+
+from aresponses.main import ResponsesMockServer as Server
+import pytest
+
+from aiopyarr.exceptions import ArrAuthenticationException, ArrException
+from aiopyarr.fleet import Fleet
+from aiopyarr.models.host_configuration import PyArrHostConfiguration
+from aiopyarr.radarr_client import RadarrClient
+from aiopyarr.sonarr_client import SonarrClient
+
+from . import API_TOKEN, RADARR_API, load_fixture
+
+
+@pytest.mark.asyncio
+async def test_fleet_gather(aresponses: Server) -> None:
+    """Test calling a method on every instance with partial results."""
+
+    async def slow_handler(_):
+        await asyncio.sleep(1)
+        return aresponses.Response(status=200, text="[]")
+
+    for port, response in (
+        (
+            7878,
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("common/diskspace.json"),
+            ),
+        ),
+        (7879, aresponses.Response(status=401)),
+        (7880, slow_handler),
+    ):
+        aresponses.add(
+            f"127.0.0.1:{port}", f"/api/{RADARR_API}/diskspace", "GET", response
+        )
+
+    async with Fleet() as fleet:
+        for name, port in (("hd", 7878), ("4k", 7879), ("kids", 7880)):
+            fleet.add(
+                name,
+                RadarrClient,
+                ipaddress="127.0.0.1",
+                port=port,
+                api_token=API_TOKEN,
+            )
+        fleet.add(
+            "tv",
+            SonarrClient,
+            host_configuration=PyArrHostConfiguration(
+                api_token=API_TOKEN, ipaddress="127.0.0.1"
+            ),
+        )
+        with pytest.raises(ArrException):
+            fleet.add("hd", RadarrClient, api_token=API_TOKEN)
+        assert list(fleet) == ["hd", "4k", "kids", "tv"]
+        session = fleet.session
+        assert fleet["hd"]._session is session  # pylint: disable=W0212
+
+        result = await fleet.gather("async_get_diskspace", app="Radarr", deadline=0.5)
+        assert list(result.results) == ["hd"]
+        assert result.results["hd"][0].freeSpace == 16187217043456
+        assert isinstance(result.errors["4k"], ArrAuthenticationException)
+        assert result.timeouts == ["kids"]
+
+        result = await fleet.gather("async_get_series", names=["hd"])
+        assert not (result.results or result.errors or result.timeouts)
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_fleet_gather_cancelled(aresponses: Server) -> None:
+    """Test cancelling a fan-out call cancels the calls of the instances."""
+
+    async def slow_handler(_):
+        await asyncio.sleep(1)
+        return aresponses.Response(status=200, text="[]")
+
+    aresponses.add(
+        "127.0.0.1:7878", f"/api/{RADARR_API}/diskspace", "GET", slow_handler
+    )
+    async with Fleet() as fleet:
+        fleet.add("hd", RadarrClient, ipaddress="127.0.0.1", api_token=API_TOKEN)
+        before = asyncio.all_tasks()
+        call = asyncio.ensure_future(fleet.gather("async_get_diskspace"))
+        await asyncio.sleep(0.1)
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+        await asyncio.sleep(0)
+        assert not {
+            task
+            for task in asyncio.all_tasks() - before
+            if "async_get_diskspace" in repr(task.get_coro())
+        }
@@ -0,0 +1,106 @@
+"""Tests for the cache of metadata lookups."""
+
+import pathlib
+
+from aiohttp import ClientSession
+from aresponses.main import ResponsesMockServer as Server
+import orjson
+import pytest
+
+from aiopyarr.const import ResponseMode
+from aiopyarr.lookup import LookupCache
+from aiopyarr.models.radarr import RadarrMovie
+from aiopyarr.models.sonarr import SonarrSeriesLookup
+from aiopyarr.radarr_client import RadarrClient
+from aiopyarr.sonarr_client import SonarrClient
+
+from . import RADARR_API, SONARR_API, TEST_HOST_CONFIGURATION, load_fixture
+
+
+@pytest.mark.asyncio
+async def test_lookup_cache(
+    aresponses: Server,
+    radarr_client: RadarrClient,
+    sonarr_client: SonarrClient,
+    apisession: ClientSession,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test lookups are made once per id and persist to disk."""
+    aresponses.add(
+        "127.0.0.1:7878",
+        f"/api/{RADARR_API}/movie/lookup?term=tmdb:603",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("radarr/movie-import.json"),
+        ),
+        match_querystring=True,
+    )
+    aresponses.add(
+        "127.0.0.1:8989",
+        f"/api/{SONARR_API}/series/lookup?term=tvdb:81189",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("sonarr/series-lookup.json"),
+        ),
+        match_querystring=True,
+    )
+    path = tmp_path / "lookups.json"
+    cache = LookupCache(maxsize=2, path=path)
+    movies = await cache.async_lookup_movie(radarr_client, 603)
+    again = await cache.async_lookup_movie(radarr_client, "603")
+    assert isinstance(again[0], RadarrMovie)
+    assert again[0] is not movies[0]
+    assert again[0].title == movies[0].title
+    series = await cache.async_lookup_series(sonarr_client, 81189)
+    assert isinstance(series[0], SonarrSeriesLookup)
+    assert len(aresponses.history) == 2
+    cache.save()
+
+    cache = LookupCache(maxsize=1, path=path)
+    assert len(cache) == 1
+    series = await cache.async_lookup_series(sonarr_client, 81189)
+    assert isinstance(series[0], SonarrSeriesLookup)
+    assert len(aresponses.history) == 2
+
+    with sonarr_client.response_mode(ResponseMode.RAW):
+        raw = await cache.async_lookup_series(sonarr_client, 81189)
+    assert raw[0]["title"] == series[0].title
+    raw[0]["title"] = "changed"
+    with sonarr_client.response_mode(ResponseMode.BYTES):
+        data = await cache.async_lookup_series(sonarr_client, 81189)
+    assert orjson.loads(data)[0]["title"] == series[0].title
+    compact = SonarrClient(
+        host_configuration=TEST_HOST_CONFIGURATION,
+        session=apisession,
+        compact_models=True,
+    )
+    series = await cache.async_lookup_series(compact, 81189)
+    assert not series[0].__dict__
+    assert series[0].title == orjson.loads(data)[0]["title"]
+    assert len(aresponses.history) == 2
+
+    aresponses.add(
+        "127.0.0.1:7878",
+        f"/api/{RADARR_API}/movie/lookup?term=tmdb:1",
+        "GET",
+        aresponses.Response(
+            status=200, headers={"Content-Type": "application/json"}, text="[]"
+        ),
+        match_querystring=True,
+        repeat=2,
+    )
+    cache = LookupCache(negative_ttl=0)
+    assert await cache.async_lookup_movie(radarr_client, 1) == []
+    assert await cache.async_lookup_movie(radarr_client, 1) == []
+    assert len(aresponses.history) == 4
+
+    with pytest.raises(ValueError):
+        LookupCache().save()
+    cache = LookupCache()
+    cache._store("Radarr:tmdb:1", 0, [])  # pylint: disable=protected-access
+    cache.save(path)
+    assert len(LookupCache(path=path)) == 0
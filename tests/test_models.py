@@ -0,0 +1,180 @@
+"""Tests for the generated model constructors."""
+
+from datetime import date, datetime, timezone
+import inspect
+from io import BytesIO
+import logging
+import pathlib
+import pickle
+import subprocess
+import sys
+
+import orjson
+import pytest
+
+from aiopyarr.models import (
+    lidarr,
+    lidarr_common,
+    radarr,
+    radarr_common,
+    readarr,
+    readarr_common,
+    request,
+    request_common,
+    sonarr,
+    sonarr_common,
+)
+from aiopyarr.models.base import (
+    BaseModel,
+    build,
+    datetime_cache_info,
+    dumps,
+    get_datetime,
+    get_enum_value,
+    toraw,
+)
+from aiopyarr.models.const import ProtocolType
+from aiopyarr.models.radarr import RadarrMovie, RadarrMovieEditor
+from aiopyarr.models.request import Command, HealthType
+from aiopyarr.models.sonarr import SonarrEventType
+
+MODULES = {  # pylint: disable=consider-using-namedtuple-or-dataclass
+    "common": (request, request_common),
+    "lidarr": (lidarr, lidarr_common),
+    "radarr": (radarr, radarr_common),
+    "readarr": (readarr, readarr_common),
+    "sonarr": (sonarr, sonarr_common),
+}
+
+
+def _models(*modules) -> list[type[BaseModel]]:
+    """Return the models defined in modules."""
+    return [
+        model
+        for module in modules
+        for model in vars(module).values()
+        if isinstance(model, type)
+        and issubclass(model, BaseModel)
+        and model.__module__ == module.__name__
+    ]
+
+
+def _dump(obj: BaseModel) -> bytes:
+    """Pickle obj without the memo, so only values and classes are compared."""
+    pickler = pickle.Pickler(buffer := BytesIO())
+    pickler.fast = True
+    pickler.dump(obj)
+    return buffer.getvalue()
+
+
+def _outcomes() -> list:
+    """Build the models of each app from its fixtures and record the results."""
+    outcomes = []
+    fixtures = pathlib.Path(__file__).parent.joinpath("fixtures")
+    for path in sorted(fixtures.rglob("*.json")):
+        data = orjson.loads(path.read_bytes())
+        for model in _models(*MODULES[path.parent.name], *MODULES["common"]):
+            for item in data if isinstance(data, list) else [data]:
+                try:
+                    outcomes.append(_dump(model(item)))
+                except Exception as err:  # pylint: disable=broad-except
+                    outcomes.append((type(err), str(err)))
+    return outcomes
+
+
+def test_compiled_models(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test generated constructors build the same models as the generic one."""
+    compiled = _outcomes()
+    for model in _models(*(module for app in MODULES.values() for module in app)):
+        assert model._build is not BaseModel._build  # pylint: disable=W0212
+        monkeypatch.setattr(model, "_build", BaseModel._build)  # pylint: disable=W0212
+
+    assert compiled == _outcomes()
+
+
+def test_compiled_models_stale_source(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the generic constructor is used when the source doesn't match."""
+
+    class _Model(BaseModel):  # pylint: disable=too-few-public-methods
+        value: int
+
+        def __post_init__(self):
+            """Post init."""
+            self.value = 1
+
+    monkeypatch.setattr(
+        inspect, "getsource", lambda _: "def __post_init__(self):\n    self.value = 2\n"
+    )
+    with caplog.at_level(logging.DEBUG):
+        assert _Model({}).value == 1
+    assert _Model._build is BaseModel._build  # pylint: disable=W0212
+    assert "_Model with the generic _build" in caplog.text
+
+
+def test_datetime_cache() -> None:
+    """Test equal timestamp strings share one parsed datetime."""
+    before = datetime_cache_info()
+    value = "2017-01-26T01:30:00Z"
+    assert get_datetime(value) is get_datetime(value[:-1] + "Z")
+    assert get_datetime(value, utc=True) is get_datetime(value, utc=True)
+    assert get_datetime(value).tzinfo is None
+    assert get_datetime(value, utc=True).tzinfo is not None
+    assert get_datetime("20170126") == 20170126
+    after = datetime_cache_info()
+    assert after["naive"].hits - before["naive"].hits >= 1
+    assert after["utc"].hits - before["utc"].hits >= 1
+
+
+def test_enum_values() -> None:
+    """Test enum members are resolved from their names and values."""
+    assert get_enum_value("torrent") is ProtocolType.TORRENT
+    assert get_enum_value("1") is ProtocolType.USENET
+    assert get_enum_value("01") is ProtocolType.USENET
+    assert get_enum_value("ftp") == "ftp"
+    assert get_enum_value("warning", HealthType) is HealthType.WARNING
+    assert get_enum_value("imported", SonarrEventType) is SonarrEventType.IMPORTED
+    assert get_enum_value("3", SonarrEventType) is SonarrEventType.IMPORTED
+
+
+@pytest.mark.parametrize("mode", [{}, {"lazy": True}, {"compact": True}])
+def test_dumps(mode: dict) -> None:
+    """Test models serialize to the same JSON as through toraw."""
+    fixture = pathlib.Path(__file__).parent.joinpath("fixtures/radarr/movie.json")
+    movies = build([orjson.loads(fixture.read_bytes())] * 2, RadarrMovie, **mode)
+    editor = RadarrMovieEditor({"movieIds": [1, 2], "monitored": True})
+    data = {
+        "movies": movies,
+        "editor": editor,
+        "values": ((1, 2), {3}, b"ab", date(2020, 1, 2)),
+        "times": [datetime(2020, 1, 2, 3, 4, 5, 6), datetime.now(timezone.utc)],
+    }
+    assert dumps(data) == orjson.dumps(toraw(data))
+    assert dumps(editor) == orjson.dumps(toraw(editor))
+
+
+def test_lazy_package_import() -> None:
+    """Test importing the package or one client doesn't load other models."""
+    code = (
+        "import sys, aiopyarr; loaded = set(sys.modules); "
+        "from aiopyarr.sonarr_client import SonarrClient; "
+        "print(sorted(m for m in loaded if m.startswith('aiopyarr.models.')), "
+        "sorted(m for m in sys.modules if m.startswith('aiopyarr.models.radarr')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=pathlib.Path(__file__).parent.parent,
+        text=True,
+    )
+    assert result.stdout.split() == ["[]", "[]"]
+
+    import aiopyarr  # pylint: disable=import-outside-toplevel
+
+    assert aiopyarr.RadarrMovie is RadarrMovie
+    assert aiopyarr.Command is Command
+    assert "SonarrSeries" in dir(aiopyarr)
+    with pytest.raises(AttributeError):
+        aiopyarr.RadarrNothing  # pylint: disable=pointless-statement
@@ -0,0 +1,69 @@
+"""Tests for the shared release searches."""
+
+import asyncio
+
+from aresponses.main import ResponsesMockServer as Server
+import pytest
+
+from aiopyarr.exceptions import ArrException
+from aiopyarr.radarr_client import RadarrClient
+from aiopyarr.releases import ReleaseSearches
+
+from . import RADARR_API, load_fixture
+
+
+@pytest.mark.asyncio
+async def test_release_searches(
+    aresponses: Server, radarr_client: RadarrClient
+) -> None:
+    """Test searches of a target are shared and their releases downloaded."""
+
+    async def release_handler(_):
+        await asyncio.sleep(0.1)
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("radarr/release.json"),
+        )
+
+    for movieid in (1, 2):
+        aresponses.add(
+            "127.0.0.1:7878",
+            f"/api/{RADARR_API}/release?movieId={movieid}",
+            "GET",
+            release_handler,
+            match_querystring=True,
+        )
+    aresponses.add(
+        "127.0.0.1:7878",
+        f"/api/{RADARR_API}/release",
+        "POST",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("radarr/release.json"),
+        ),
+        match_querystring=True,
+    )
+    searches = ReleaseSearches()
+    search = searches.search(radarr_client, movieid=1)
+    assert searches.search(radarr_client, movieid=1) is search
+    assert search.results is None
+    assert await search.async_wait(0.01) is None
+    assert not search.done
+
+    with pytest.raises(ArrException):
+        await searches.async_download(radarr_client, "string")
+    releases = await searches.async_search(radarr_client, movieid=1)
+    assert releases is search.results
+    assert search.done and not search.failed
+    data = await searches.async_download(radarr_client, "string")
+    assert data[0].guid == "string"
+    assert len(aresponses.history) == 2
+
+    with pytest.raises(ArrException):
+        await searches.async_download(radarr_client, "other")
+    searches = ReleaseSearches(ttl=0)
+    await searches.async_search(radarr_client, movieid=2)
+    with pytest.raises(ArrException):
+        await searches.async_download(radarr_client, "string")
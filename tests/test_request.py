@@ -2,13 +2,18 @@
 
 # pylint:disable=line-too-long, too-many-lines, too-many-statements
 import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 import json
+import pickle
+from unittest.mock import patch
 
-from aiohttp.client import ClientSession
+from aiohttp.client import ClientResponse, ClientSession
 from aresponses.main import ResponsesMockServer as Server
 import pytest
 
+from aiopyarr import request_client
+from aiopyarr.const import HTTPMethod, ResponseMode
 from aiopyarr.exceptions import (
     ArrAuthenticationException,
     ArrConnectionException,
@@ -17,8 +22,9 @@ from aiopyarr.exceptions import (
     ArrZeroConfException,
 )
 from aiopyarr.lidarr_client import LidarrClient
-from aiopyarr.models.base import get_enum_value
+from aiopyarr.models.base import build, changed_fields, dumps, get_enum_value
 from aiopyarr.models.const import ProtocolType
+from aiopyarr.models.radarr import RadarrMovie, RadarrParse
 from aiopyarr.models.request import (
     AllowFingerprintingType,
     AuthenticationType,
@@ -30,6 +36,7 @@ from aiopyarr.models.request import (
     CommandTriggerType,
     CustomFilter,
     DelayProfile,
+    Diskspace,
     DownloadClient,
     DownloadClientConfig,
     HealthType,
@@ -58,6 +65,7 @@ from aiopyarr.models.request import (
 from aiopyarr.radarr_client import RadarrClient
 from aiopyarr.readarr_client import ReadarrClient
 from aiopyarr.sonarr_client import SonarrClient
+from aiopyarr.stream import ArraySplitter
 
 from . import (
     API_TOKEN,
@@ -122,6 +130,144 @@ async def test_attributes(aresponses: Server, radarr_client: RadarrClient) -> No
     assert data["queued"] == "2021-11-29T20:03:16Z"
 
 
+@pytest.mark.asyncio
+async def test_lazy_models(aresponses: Server, radarr_client: RadarrClient) -> None:
+    """Test models are only built when first accessed."""
+    for _ in range(2):
+        aresponses.add(
+            "127.0.0.1:7878",
+            f"/api/{RADARR_API}/movie",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("radarr/movie.json"),
+            ),
+            match_querystring=True,
+        )
+    eager = await radarr_client.async_get_movies()
+
+    async with ClientSession() as session:
+        client = RadarrClient(
+            host_configuration=TEST_HOST_CONFIGURATION,
+            session=session,
+            lazy_models=True,
+        )
+        data = await client.async_get_movies()
+
+    assert isinstance(data, RadarrMovie)
+    assert type(data) is not RadarrMovie  # pylint: disable=unidiomatic-typecheck
+    assert data.title == "string"
+    assert type(data) is RadarrMovie  # pylint: disable=unidiomatic-typecheck
+    assert type(data.__dict__["ratings"]) is not type(eager.ratings)
+    assert isinstance(data.ratings.imdb.votes, int)
+    assert data.attributes == eager.attributes
+
+
+@pytest.mark.asyncio
+async def test_compact_models(aresponses: Server, radarr_client: RadarrClient) -> None:
+    """Test models stored in slots."""
+    for _ in range(2):
+        aresponses.add(
+            "127.0.0.1:7878",
+            f"/api/{RADARR_API}/movie",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("radarr/movie.json"),
+            ),
+            match_querystring=True,
+        )
+    eager = await radarr_client.async_get_movies()
+
+    async with ClientSession() as session:
+        client = RadarrClient(
+            host_configuration=TEST_HOST_CONFIGURATION,
+            session=session,
+            compact_models=True,
+        )
+        data = await client.async_get_movies()
+
+    assert isinstance(data, RadarrMovie)
+    assert not data.__dict__
+    assert data.ratings.imdb.votes == eager.ratings.imdb.votes
+    assert data.added == eager.added
+    assert data.attributes == eager.attributes
+
+    with pytest.raises(ArrException):
+        RadarrClient(
+            host_configuration=TEST_HOST_CONFIGURATION,
+            lazy_models=True,
+            compact_models=True,
+        )
+
+
+@pytest.mark.asyncio
+async def test_track_changes(aresponses: Server) -> None:
+    """Test tracked models are sent back as received with only changes applied."""
+    sent = []
+
+    async def handler(request):
+        sent.append(await request.json())
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("radarr/movie.json"),
+        )
+
+    aresponses.add(
+        "127.0.0.1:7878",
+        f"/api/{RADARR_API}/movie",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("radarr/movie.json"),
+        ),
+        match_querystring=True,
+    )
+    aresponses.add("127.0.0.1:7878", f"/api/{RADARR_API}/movie", "PUT", handler)
+
+    async with ClientSession() as session:
+        client = RadarrClient(
+            host_configuration=TEST_HOST_CONFIGURATION,
+            session=session,
+            track_changes=True,
+        )
+        data = await client.async_get_movies()
+        assert isinstance(data, RadarrMovie)
+        assert not changed_fields(data)
+        data.monitored = False
+        data.images[0].url = "changed"
+        assert changed_fields(data) == {"monitored", "images"}
+        copy = pickle.loads(pickle.dumps(data))
+        assert changed_fields(copy) == {"monitored", "images"}
+        assert dumps(copy) == dumps(data)
+        await client.async_edit_movies(data)
+
+    expected = json.loads(load_fixture("radarr/movie.json"))
+    expected["monitored"] = False
+    expected["images"][0]["url"] = "changed"
+    assert sent == [expected]
+
+    exclusion = build(
+        {"id": 5, "movieTitle": "string", "tmdbId": 1}, ImportListExclusion, track=True
+    )
+    delattr(exclusion, "id")
+    assert changed_fields(exclusion) == {"id"}
+    assert json.loads(dumps(exclusion)) == {"movieTitle": "string", "tmdbId": 1}
+    exclusion = pickle.loads(pickle.dumps(exclusion))
+    assert json.loads(dumps(exclusion)) == {"movieTitle": "string", "tmdbId": 1}
+
+    with pytest.raises(ArrException):
+        RadarrClient(
+            host_configuration=TEST_HOST_CONFIGURATION,
+            compact_models=True,
+            track_changes=True,
+        )
+
+
 def test_get_no_enum_value() -> None:
     """Test getting no enum value."""
     data = get_enum_value("test")
@@ -305,6 +451,329 @@ async def test_async_get_diskspace(
     assert isinstance(data[0].totalSpace, int)
 
 
+@pytest.mark.asyncio
+async def test_decode_off_loop(aresponses: Server) -> None:
+    """Test decoding large responses in an executor."""
+    for _ in range(2):
+        aresponses.add(
+            "127.0.0.1:7878",
+            f"/api/{RADARR_API}/diskspace",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("common/diskspace.json"),
+            ),
+            match_querystring=True,
+        )
+
+    async with ClientSession() as session:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            client = RadarrClient(
+                host_configuration=TEST_HOST_CONFIGURATION,
+                session=session,
+                decode_threshold=0,
+                decode_executor=executor,
+            )
+            data = await client.async_get_diskspace()
+            assert isinstance(data[0], Diskspace)
+            assert data[0].label == "DrivePool"
+
+            client._raw_response = True  # pylint: disable=protected-access
+            data = await client.async_get_diskspace()
+            assert data[0]["label"] == "DrivePool"
+
+            aresponses.add(
+                "127.0.0.1:7878",
+                f"/api/{RADARR_API}/diskspace",
+                "GET",
+                aresponses.Response(
+                    status=200,
+                    headers={"Content-Type": "text/html"},
+                    text="<html></html>",
+                ),
+                match_querystring=True,
+                repeat=2,
+            )
+            for threshold in (0, None):
+                client._decode_threshold = threshold  # pylint: disable=protected-access
+                with pytest.raises(ArrConnectionException):
+                    await client.async_get_diskspace()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mode", [{}, {"compact_models": True}, {"track_changes": True}]
+)
+async def test_decode_in_process_pool(aresponses: Server, mode: dict) -> None:
+    """Test decoding large responses in a process pool."""
+    aresponses.add(
+        "127.0.0.1:7878",
+        f"/api/{RADARR_API}/movie",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("radarr/movie.json"),
+        ),
+        match_querystring=True,
+    )
+
+    async with ClientSession() as session:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            client = RadarrClient(
+                host_configuration=TEST_HOST_CONFIGURATION,
+                session=session,
+                decode_threshold=0,
+                decode_executor=executor,
+                **mode,
+            )
+            data = await client.async_get_movies()
+    assert isinstance(data, RadarrMovie)
+    assert data.ratings.imdb.votes == 0
+    assert pickle.loads(pickle.dumps(data)).attributes == data.attributes
+    if "track_changes" in mode:
+        assert not changed_fields(data)
+
+
+@pytest.mark.asyncio
+async def test_blocking_budget(
+    aresponses: Server, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test reporting synchronous sections over the blocking budget."""
+    aresponses.add(
+        "127.0.0.1:7878",
+        f"/api/{RADARR_API}/diskspace",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("common/diskspace.json"),
+        ),
+        match_querystring=True,
+    )
+
+    for movieid in (1, 2):
+        aresponses.add(
+            "127.0.0.1:7878",
+            f"/api/{RADARR_API}/movie/{movieid}?tmdbid={movieid}",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("radarr/movie.json"),
+            ),
+            match_querystring=True,
+        )
+
+    async with ClientSession() as session:
+        client = RadarrClient(
+            host_configuration=TEST_HOST_CONFIGURATION,
+            session=session,
+            blocking_budget=-1,
+        )
+        await client.async_get_diskspace()
+        await client.async_get_movies(1)
+        await client.async_get_movies(2)
+
+    assert client.blocking_counts["diskspace"] == 2
+    assert client.blocking_counts["movie/{id}"] == 4
+    assert "while building models for 'diskspace'" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_response_mode(
+    aresponses: Server, radarr_client: RadarrClient, sonarr_client: SonarrClient
+) -> None:
+    """Test returning responses as bytes, parsed JSON or models per call."""
+    for _ in range(4):
+        aresponses.add(
+            "127.0.0.1:7878",
+            f"/api/{RADARR_API}/diskspace",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("common/diskspace.json"),
+            ),
+            match_querystring=True,
+        )
+
+    with radarr_client.response_mode(ResponseMode.BYTES):
+        data = await radarr_client.async_get_diskspace()
+        assert data == load_fixture("common/diskspace.json").encode()
+        with radarr_client.response_mode(ResponseMode.RAW):
+            data = await radarr_client.async_get_diskspace()
+            assert data == json.loads(load_fixture("common/diskspace.json"))
+        with sonarr_client.response_mode(ResponseMode.RAW):
+            data = await radarr_client.async_get_diskspace()
+            assert isinstance(data, bytes)
+    data = await radarr_client.async_get_diskspace()
+    assert isinstance(data[0], Diskspace)
+
+    aresponses.add(
+        "127.0.0.1:7878",
+        f"/api/{RADARR_API}/system/restart",
+        "POST",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text='{"restarting": true}',
+        ),
+        match_querystring=True,
+    )
+    aresponses.add(
+        "127.0.0.1:7878",
+        f"/api/{RADARR_API}/notification/testall",
+        "POST",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text='[{"isValid": true}, {"isValid": false}]',
+        ),
+        match_querystring=True,
+    )
+    aresponses.add(
+        "127.0.0.1:7878",
+        f"/api/{RADARR_API}/filesystem/type?path=test",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text='{"type": "folder"}',
+        ),
+        match_querystring=True,
+    )
+    with radarr_client.response_mode(ResponseMode.BYTES):
+        assert await radarr_client.async_get_filesystem_media_type("test") == "folder"
+        assert await radarr_client.async_system_restart() is True
+        assert await radarr_client.async_test_all_notifications() is False
+
+
+@pytest.mark.asyncio
+async def test_fields(aresponses: Server, radarr_client: RadarrClient) -> None:
+    """Test only keeping the requested keys of returned objects."""
+    for _ in range(2):
+        aresponses.add(
+            "127.0.0.1:7878",
+            f"/api/{RADARR_API}/movie",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=f"[{load_fixture('radarr/movie.json')}]",
+            ),
+            match_querystring=True,
+        )
+    fields = ["id", "tmdbId", "path", "monitored", "sizeOnDisk", "missing"]
+    data = await radarr_client.async_get_movies(fields=fields)
+
+    assert data[0].id == 0
+    assert data[0].path == "string"
+    assert data[0].monitored is True
+    assert "title" not in data[0].attributes
+    assert "missing" not in data[0].attributes
+
+    with radarr_client.response_mode(ResponseMode.RAW):
+        data = await radarr_client.async_get_movies(fields=fields)
+    assert data == [
+        {"id": 0, "tmdbId": 0, "path": "string", "monitored": True, "sizeOnDisk": 0}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream(aresponses: Server, radarr_client: RadarrClient) -> None:
+    """Test yielding the items of a returned array while it is received."""
+    movie = load_fixture("radarr/movie.json")
+    for text in (f"[{movie}, {movie},{movie}]", f"[{movie}]", movie):
+        aresponses.add(
+            "127.0.0.1:7878",
+            f"/api/{RADARR_API}/movie",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=text,
+            ),
+            match_querystring=True,
+        )
+
+    data = [movie async for movie in radarr_client.async_iter_movies()]
+    assert len(data) == 3
+    assert isinstance(data[2], RadarrMovie)
+    assert data[2].attributes == RadarrMovie(json.loads(movie)).attributes
+
+    with radarr_client.response_mode(ResponseMode.BYTES):
+        data = [movie async for movie in radarr_client.async_iter_movies()]
+    assert [json.loads(item) for item in data] == [json.loads(movie)]
+
+    with pytest.raises(ArrException):
+        async for _ in radarr_client.async_iter_movies():
+            pass
+
+    aresponses.add(
+        "127.0.0.1:7878",
+        f"/api/{RADARR_API}/movie",
+        "GET",
+        aresponses.Response(status=500),
+        match_querystring=True,
+    )
+    released = []
+    release = ClientResponse.release
+    with patch.object(
+        ClientResponse,
+        "release",
+        autospec=True,
+        side_effect=lambda response: released.append(release(response)),
+    ):
+        with pytest.raises(ArrException):
+            async for _ in radarr_client.async_iter_movies():
+                pass
+    assert len(released) == 1
+
+
+def test_array_splitter() -> None:
+    """Test splitting arrays received in chunks of any size."""
+    body = b'[1, "a,]\\"}", null ,{"x":[1,{"y":"]"}]}, [ ] ,true, "\\\\"]'
+    for size in range(1, len(body) + 1):
+        splitter = ArraySplitter()
+        items = []
+        for start in range(0, len(body), size):
+            items += splitter.feed(body[start : start + size])
+        splitter.close()
+        assert [json.loads(item) for item in items] == json.loads(body)
+
+    splitter = ArraySplitter()
+    splitter.feed(b"[{}")
+    with pytest.raises(ArrException):
+        splitter.close()
+
+
+@pytest.mark.asyncio
+async def test_request_without_body(
+    aresponses: Server, radarr_client: RadarrClient
+) -> None:
+    """Test requests without data are sent without a body."""
+    sent = []
+
+    async def handler(request):
+        sent.append((request.headers.get("Content-Type"), await request.read()))
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("common/diskspace.json"),
+        )
+
+    aresponses.add("127.0.0.1:7878", f"/api/{RADARR_API}/diskspace", "GET", handler)
+    aresponses.add("127.0.0.1:7878", f"/api/{RADARR_API}/diskspace", "POST", handler)
+    await radarr_client.async_get_diskspace()
+    await radarr_client._async_request(  # pylint: disable=protected-access
+        "diskspace", method=HTTPMethod.POST
+    )
+
+    assert sent == [(None, b""), ("application/json", b"null")]
+
+
 @pytest.mark.asyncio
 async def test_async_get_root_folders(
     aresponses: Server, radarr_client: RadarrClient, sonarr_client: SonarrClient
@@ -1022,10 +1491,65 @@ async def test_async_get_languages(
 
 
 @pytest.mark.asyncio
-async def test_async_get_localization(
+async def test_async_load_reference_data(
     aresponses: Server, readarr_client: ReadarrClient
+) -> None:
+    """Test loading the reference data of an app in one snapshot."""
+    fixtures = {
+        "tag": "common/tag.json",
+        "qualityprofile": "common/qualityprofile.json",
+        "metadataprofile": "readarr/metadata-profile.json",
+        "releaseprofile": "common/releaseprofile.json",
+        "rootfolder": "readarr/rootfolder.json",
+        "language": "common/language.json",
+        "downloadclient": "common/downloadclient.json",
+        "indexer": "common/indexer.json",
+    }
+    for endpoint, fixture in fixtures.items():
+        text = load_fixture(fixture)
+        aresponses.add(
+            "127.0.0.1:8787",
+            f"/api/{READARR_API}/{endpoint}",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=text if text.startswith("[") else f"[{text}]",
+            ),
+            match_querystring=True,
+        )
+    data = await readarr_client.async_load_reference_data()
+    assert len(data.kinds) == len(fixtures)
+    assert isinstance(data.by_id("tags", 1), Tag)
+    assert data.by_name("tags", "AMZN") is data["tags"][0]
+    assert data.by_name("root_folders", "books").id == 1
+    assert data.by_name("languages", "any").id == -1
+    assert data.by_id("indexers", 5) is None
+    assert data.names("tags", [1, 5]) == ["amzn"]
+    assert "metadata_profiles" in data
+    assert await readarr_client.async_load_reference_data(max_age=60) is data
+
+
+@pytest.mark.asyncio
+async def test_async_get_localization(
+    aresponses: Server,
+    apisession: ClientSession,
+    readarr_client: ReadarrClient,
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     """Test getting localization."""
+    for _ in range(3):
+        aresponses.add(
+            "127.0.0.1:8787",
+            f"/api/{READARR_API}/system/status",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=load_fixture("common/system-status.json"),
+            ),
+            match_querystring=True,
+        )
     aresponses.add(
         "127.0.0.1:8787",
         f"/api/{READARR_API}/localization",
@@ -1037,8 +1561,29 @@ async def test_async_get_localization(
         ),
         match_querystring=True,
     )
+    monkeypatch.setattr(request_client, "_LOCALIZATIONS", {})
     data = await readarr_client.async_get_localization()
+    again = await readarr_client.async_get_localization()
+    assert again is not data
+    assert again.Strings == data.Strings
+    again.Strings = None  # type: ignore[assignment]
+    async with ReadarrClient(
+        session=apisession, host_configuration=TEST_HOST_CONFIGURATION
+    ) as client:
+        monkeypatch.setattr(request_client, "_APP_VERSION_TTL", -1)
+        assert (await client.async_get_localization()).Strings == data.Strings
+        assert (await client.async_get_localization()).Strings == data.Strings
+    assert len(aresponses.history) == 4
+    assert json.loads(dumps(data))["Strings"]["About"] == "string"
     data = data.Strings
+    assert data["About"] == "string"
+    assert len(data) == len(dict(data)) > 1000
+    with pytest.raises(AttributeError):
+        data.About = "changed"  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        data.NotAString  # pylint: disable=pointless-statement
+    with pytest.raises(AttributeError):
+        getattr(data, "")
     assert data.About == "string"
     assert data.Absolute == "string"
     assert data.AcceptConfirmationModal == "string"
@@ -2540,6 +3085,38 @@ async def test_async_get_localization(
     assert data.YouCanAlsoSearch == "string"
 
 
+@pytest.mark.asyncio
+async def test_async_get_localization_without_strings(
+    aresponses: Server,
+    readarr_client: ReadarrClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test getting localization from a response without strings."""
+    aresponses.add(
+        "127.0.0.1:8787",
+        f"/api/{READARR_API}/system/status",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("common/system-status.json"),
+        ),
+        match_querystring=True,
+    )
+    aresponses.add(
+        "127.0.0.1:8787",
+        f"/api/{READARR_API}/localization",
+        "GET",
+        aresponses.Response(
+            status=200, headers={"Content-Type": "application/json"}, text="{}"
+        ),
+        match_querystring=True,
+    )
+    monkeypatch.setattr(request_client, "_LOCALIZATIONS", {})
+    data = await readarr_client.async_get_localization()
+    assert len(data.Strings) == 0
+
+
 @pytest.mark.asyncio
 async def test_async_get_image(
     aresponses: Server, lidarr_client: LidarrClient, sonarr_client: SonarrClient
@@ -4321,3 +4898,48 @@ async def test_async_command_other(
         match_querystring=True,
     )
     await readarr_client.async_command_other("test")
+
+
+@pytest.mark.asyncio
+async def test_async_parse_many(
+    aresponses: Server, radarr_client: RadarrClient
+) -> None:
+    """Test parsing titles once each, remembering the results."""
+    aresponses.add(
+        "127.0.0.1:7878",
+        f"/api/{RADARR_API}/parse?title=test",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("radarr/parse.json"),
+        ),
+        match_querystring=True,
+    )
+    aresponses.add(
+        "127.0.0.1:7878",
+        f"/api/{RADARR_API}/parse?title=other",
+        "GET",
+        aresponses.Response(status=500),
+        match_querystring=True,
+    )
+    results = await radarr_client.async_parse_many(
+        ["test", "other", " TEST", "test"], return_exceptions=True
+    )
+    assert isinstance(results[0], RadarrParse)
+    assert results[0] is not results[2]
+    assert results[0].attributes == results[2].attributes == results[3].attributes
+    assert isinstance(results[1], ArrException)
+    assert len(aresponses.history) == 2
+    with radarr_client.response_mode(ResponseMode.BYTES):
+        data = await radarr_client.async_parse_many(["test"])
+    assert json.loads(data[0]) == json.loads(load_fixture("radarr/parse.json"))
+    with radarr_client.response_mode(ResponseMode.RAW):
+        data = await radarr_client.async_parse_many(["test"])
+    assert data == [json.loads(load_fixture("radarr/parse.json"))]
+    data = await radarr_client.async_parse_many(["test"])
+    assert isinstance(data[0], RadarrParse)
+    assert len(aresponses.history) == 2
+    radarr_client.clear_parse_cache()
+    with pytest.raises(ArrException):
+        await radarr_client.async_parse_many(["test"])
@@ -0,0 +1,87 @@
+"""Tests for the search across apps."""
+
+import asyncio
+
+from aresponses.main import ResponsesMockServer as Server
+import pytest
+
+from aiopyarr.const import ResponseMode
+from aiopyarr.models.radarr import RadarrMovie
+from aiopyarr.models.sonarr import SonarrSeriesLookup
+from aiopyarr.radarr_client import RadarrClient
+from aiopyarr.search import Search
+from aiopyarr.sonarr_client import SonarrClient
+
+from . import RADARR_API, SONARR_API, load_fixture
+
+
+@pytest.mark.asyncio
+async def test_async_search_everything(
+    aresponses: Server, radarr_client: RadarrClient, sonarr_client: SonarrClient
+) -> None:
+    """Test searching apps concurrently with cached and failed searches."""
+    aresponses.add(
+        "127.0.0.1:8989",
+        f"/api/{SONARR_API}/series/lookup?term=The+Matrix",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("sonarr/series-lookup.json"),
+        ),
+        match_querystring=True,
+    )
+    aresponses.add(
+        "127.0.0.1:7878",
+        f"/api/{RADARR_API}/movie/lookup?term=The+Matrix",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=load_fixture("radarr/movie-import.json"),
+        ),
+        match_querystring=True,
+    )
+    search = Search([sonarr_client, radarr_client])
+    results, again = await asyncio.gather(
+        search.async_search_everything("The Matrix"),
+        search.async_search_everything("the  matrix"),
+    )
+    assert [result.app for result in results] == ["Sonarr", "Radarr"]
+    assert isinstance(results[0].item, SonarrSeriesLookup)
+    assert isinstance(results[1].item, RadarrMovie)
+    assert results[1].client is radarr_client
+    assert again[1].item is not results[1].item
+    assert again[1].item.title == results[1].item.title
+    with radarr_client.response_mode(ResponseMode.RAW):
+        cached = await search.async_search_everything("THE MATRIX")
+    assert isinstance(cached[0].item, SonarrSeriesLookup)
+    assert cached[1].item["title"] == results[1].item.title
+    assert len(aresponses.history) == 2
+
+    aresponses.add(
+        "127.0.0.1:8989",
+        f"/api/{SONARR_API}/series/lookup?term=nothing",
+        "GET",
+        aresponses.Response(
+            status=200, headers={"Content-Type": "application/json"}, text="[]"
+        ),
+        match_querystring=True,
+        repeat=2,
+    )
+    for response in (
+        aresponses.Response(status=500),
+        aresponses.Response(
+            status=200, headers={"Content-Type": "application/json"}, text="[]"
+        ),
+    ):
+        aresponses.add(
+            "127.0.0.1:7878",
+            f"/api/{RADARR_API}/movie/lookup?term=nothing",
+            "GET",
+            response,
+            match_querystring=True,
+        )
+    for _ in range(3):
+        assert await search.async_search_everything("nothing") == []
+    assert len(aresponses.history) == 6
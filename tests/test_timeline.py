@@ -0,0 +1,76 @@
+"""Tests for the history timeline of many apps."""
+
+# pylint:disable=line-too-long
+from aresponses.main import ResponsesMockServer as Server
+import orjson
+import pytest
+
+from aiopyarr.radarr_client import RadarrClient
+from aiopyarr.sonarr_client import SonarrClient
+from aiopyarr.timeline import async_iter_history
+
+from . import RADARR_API, SONARR_API, load_fixture
+
+
+def _history(fixture: str, total: int, *dates: str) -> str:
+    """Return a history page of the fixture record at dates."""
+    data = orjson.loads(load_fixture(fixture))
+    record = data["records"][0]
+    data["totalRecords"] = total
+    data["records"] = [
+        record | {"id": index, "date": date} for index, date in enumerate(dates)
+    ]
+    return orjson.dumps(data).decode()
+
+
+@pytest.mark.asyncio
+async def test_async_iter_history(
+    aresponses: Server, radarr_client: RadarrClient, sonarr_client: SonarrClient
+) -> None:
+    """Test merging histories while only reading the pages needed."""
+    for page, dates in (
+        (1, ("2022-01-05T00:00:00Z", "2022-01-03T00:00:00Z")),
+        (2, ("2022-01-01T00:00:00Z",)),
+    ):
+        aresponses.add(
+            "127.0.0.1:8989",
+            f"/api/{SONARR_API}/history?page={page}&pageSize=2&sortKey=date&sortDirection=descending",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/json"},
+                text=_history("sonarr/history.json", 3, *dates),
+            ),
+            match_querystring=True,
+            repeat=3 - page,
+        )
+    aresponses.add(
+        "127.0.0.1:7878",
+        f"/api/{RADARR_API}/history?page=1&pageSize=2&sortKey=date&sortDirection=descending",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=_history(
+                "radarr/history.json", 2, "2022-01-04T00:00:00Z", "2022-01-02T00:00:00Z"
+            ),
+        ),
+        match_querystring=True,
+        repeat=2,
+    )
+
+    events = []
+    async for client, record in async_iter_history([sonarr_client, radarr_client], 2):
+        events.append((client.__name__, record.date.day))
+        if len(events) == 3:
+            break
+    assert events == [("Sonarr", 5), ("Radarr", 4), ("Sonarr", 3)]
+    assert len(aresponses.history) == 2
+
+    events = [
+        (client.__name__, record.date.day)
+        async for client, record in async_iter_history(
+            [sonarr_client, radarr_client], 2
+        )
+    ]
+    assert [day for _, day in events] == [5, 4, 3, 2, 1]